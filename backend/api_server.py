@@ -1,30 +1,54 @@
 """
 Simplified FastAPI server for Bedrock Agent Gameplay Analysis.
 All endpoints consolidated in one file for clarity.
-No DynamoDB dependency - uses in-memory storage and S3.
+No DynamoDB dependency - uses Redis (or in-memory fallback) and S3.
 """
 
+import hashlib
+import io
 import os
-import json
 import uuid
 import asyncio
 import logging
-from datetime import datetime
+import queue
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from pydantic import BaseModel, ConfigDict
 import boto3
+import orjson
+from boto3.s3.transfer import TransferConfig
+from cachetools import TTLCache
+from botocore.config import Config
 from dotenv import load_dotenv
 
-# Set up logging
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+# Set up logging - records go to an in-process queue and a background
+# listener thread drains them to disk/stderr, so request handlers never
+# block on file writes
+_log_queue = queue.SimpleQueue()
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = RotatingFileHandler('api_server.log', maxBytes=50_000_000, backupCount=5)
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+log_listener = QueueListener(
+    _log_queue, _file_handler, _stream_handler, respect_handler_level=True
+)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('api_server.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
@@ -34,17 +58,160 @@ load_dotenv()
 # Import shared helpers
 from shared.aws_helpers import (
     generate_presigned_upload_url,
-    get_bedrock_agent_runtime_client,
     invoke_data_automation_and_get_results,
-    get_s3_client,
-    get_bucket_name
+    get_bucket_name,
+    get_region
+)
+
+# Shared AWS clients - boto3 client construction resolves credentials and
+# loads service models on every call, so build once per process and reuse.
+_BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 5}
+)
+_AWS_SESSION = boto3.session.Session(region_name=get_region())
+S3_CLIENT = _AWS_SESSION.client('s3', config=_BOTO_CONFIG)
+BEDROCK_AGENT_RUNTIME_CLIENT = _AWS_SESSION.client('bedrock-agent-runtime', config=_BOTO_CONFIG)
+
+# Multipart upload kicks in above 8 MB; small payloads still go as one PUT
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
 )
 
+# Configuration
+BEDROCK_AGENT_ID = os.environ.get('BEDROCK_AGENT_ID')
+BEDROCK_AGENT_ALIAS_ID = os.environ.get('BEDROCK_AGENT_ALIAS_ID', 'TSTALIASID')
+REDIS_URL = os.environ.get('REDIS_URL')
+SESSION_TTL_SECONDS = int(os.environ.get('SESSION_TTL_SECONDS', 24 * 3600))
+MAX_SESSION_MESSAGES = int(os.environ.get('MAX_SESSION_MESSAGES', 200))
+
+# Cap in-flight Bedrock agent calls so bursts queue cheaply in-process
+# instead of tripping the per-account TPS limit and paying boto3's
+# exponential-backoff retries over the network
+_BEDROCK_SEM = asyncio.Semaphore(int(os.environ.get('BEDROCK_CONCURRENCY', 8)))
+
+# Invariant invoke_agent arguments, built once; per-request fields are
+# merged in at call time
+_BASE_INVOKE_PARAMS = {
+    'agentId': BEDROCK_AGENT_ID,
+    'agentAliasId': BEDROCK_AGENT_ALIAS_ID,
+    'enableTrace': True,
+    'endSession': False
+}
+
+# Parsed analysis sections cached per video so repeated Q&A doesn't re-hit
+# S3; entries are dropped when a new analysis finishes for the video
+_analysis_cache: TTLCache = TTLCache(maxsize=128, ttl=600)
+_analysis_cache_lock = asyncio.Lock()
+
+# ============================================================================
+# STORAGE
+# ============================================================================
+
+class MetadataStore:
+    """Keyed record store backed by Redis so all uvicorn workers share state.
+
+    Falls back to a bounded per-process TTL cache when REDIS_URL is not set
+    (local dev, single worker only), so the fallback can't grow without
+    bound. Values are stored as Redis hashes with each field serialized via
+    orjson so nested lists/dicts round-trip cleanly.
+    """
+
+    def __init__(self, prefix: str, ttl: Optional[int] = None, maxsize: int = 100_000):
+        self._prefix = prefix
+        self._ttl = ttl
+        self._redis = None
+        self._local: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl or 86400)
+
+    def bind(self, redis_client) -> None:
+        """Attach the shared Redis client created in the app lifespan."""
+        self._redis = redis_client
+
+    def _key(self, record_id: str) -> str:
+        return f"{self._prefix}:{record_id}"
+
+    async def get(self, record_id: str) -> Optional[Dict[str, Any]]:
+        if self._redis is None:
+            record = self._local.get(record_id)
+            return dict(record) if record is not None else None
+        data = await self._redis.hgetall(self._key(record_id))
+        if not data:
+            return None
+        return {key.decode('utf-8'): orjson.loads(value) for key, value in data.items()}
+
+    async def set(self, record_id: str, record: Dict[str, Any]) -> None:
+        if self._redis is None:
+            self._local[record_id] = dict(record)
+            return
+        key = self._key(record_id)
+        await self._redis.hset(key, mapping={k: orjson.dumps(v) for k, v in record.items()})
+        if self._ttl:
+            await self._redis.expire(key, self._ttl)
+
+    async def update(self, record_id: str, fields: Dict[str, Any]) -> None:
+        if self._redis is None:
+            self._local.setdefault(record_id, {}).update(fields)
+            return
+        await self.set(record_id, fields)
+
+    async def delete(self, record_id: str) -> bool:
+        if self._redis is None:
+            return self._local.pop(record_id, None) is not None
+        return bool(await self._redis.delete(self._key(record_id)))
+
+    async def count(self) -> int:
+        if self._redis is None:
+            return len(self._local)
+        total = 0
+        async for _ in self._redis.scan_iter(match=f"{self._prefix}:*"):
+            total += 1
+        return total
+
+
+class SessionStore(MetadataStore):
+    """Conversation session store; entries expire after SESSION_TTL_SECONDS."""
+    pass
+
+
+video_metadata = MetadataStore('video')
+active_sessions = SessionStore('session', ttl=SESSION_TTL_SECONDS, maxsize=10_000)
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 string."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background services for the life of the process."""
+    log_listener.start()
+    redis_client = None
+    if REDIS_URL:
+        if aioredis is None:
+            raise RuntimeError('REDIS_URL is set but the redis package is not installed')
+        redis_client = aioredis.from_url(REDIS_URL)
+        video_metadata.bind(redis_client)
+        active_sessions.bind(redis_client)
+        logger.info(f"Using Redis storage at {REDIS_URL}")
+    else:
+        logger.warning("REDIS_URL not set - using in-process storage (single worker only)")
+    yield
+    if redis_client is not None:
+        await redis_client.aclose()
+    log_listener.stop()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Gameplay Analysis API",
     description="Simplified API server for Bedrock Agent gameplay analysis",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware - MUST be added before any routes
@@ -53,24 +220,45 @@ app.add_middleware(
     allow_origins=[
         "http://localhost:3000",
         "http://127.0.0.1:3000",
-        "https://production.d2y1j466l93f9u.amplifyapp.com",
-        "https://d15539by8ihpin.cloudfront.net",
-        "*"  # Allow all origins
+        "https://d15539by8ihpin.cloudfront.net"
     ],
+    # "*" + allow_credentials=True is spec-illegal and browsers reject it;
+    # Amplify preview branches are matched by a precompiled regex instead
+    allow_origin_regex=r"https://.*\.amplifyapp\.com$",
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH", "HEAD"],
     allow_headers=["*"],
     expose_headers=["*"],
-    max_age=600,  # Cache preflight requests for 10 minutes
+    max_age=86400,  # Cache preflight requests for 24 hours
 )
 
-# Configuration
-BEDROCK_AGENT_ID = os.environ.get('BEDROCK_AGENT_ID')
-BEDROCK_AGENT_ALIAS_ID = os.environ.get('BEDROCK_AGENT_ALIAS_ID', 'TSTALIASID')
+# Compress large JSON responses (analysis results can be multi-MB)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+class SSEGzipExemptMiddleware:
+    """Drop the gzip offer on the chat route before GZipMiddleware sees it.
+
+    Starlette's gzip responder funnels streamed bodies through one zlib
+    buffer with no per-chunk flush, so compressed SSE events would sit in
+    the buffer and arrive late and batched instead of streaming.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope.get('type') == 'http' and scope.get('path') == '/api/agent/conversation/message':
+            scope = dict(scope)
+            scope['headers'] = [
+                (name, value) for name, value in scope['headers']
+                if name != b'accept-encoding'
+            ]
+        await self.app(scope, receive, send)
 
-# In-memory storage (replaces DynamoDB for local dev)
-video_metadata: Dict[str, Dict[str, Any]] = {}
-active_sessions: Dict[str, Dict[str, Any]] = {}
+
+# Added after GZipMiddleware so it runs first in the request path
+app.add_middleware(SSEGzipExemptMiddleware)
 
 # Pydantic models
 class VideoUploadRequest(BaseModel):
@@ -78,6 +266,8 @@ class VideoUploadRequest(BaseModel):
     contentType: str = "video/mp4"
 
 class VideoUploadResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     uploadUrl: str
     s3Uri: str
     videoId: str
@@ -93,6 +283,7 @@ class SendMessageRequest(BaseModel):
     sessionId: str
     message: str
     videoId: Optional[str] = None
+    stream: bool = False
 
 # ============================================================================
 # HEALTH CHECK ENDPOINTS
@@ -108,15 +299,15 @@ async def health_check():
     """Detailed health check."""
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _now_iso(),
         "version": "2.0.0",
         "services": {
             "bedrock_agent": bool(BEDROCK_AGENT_ID),
             "aws_credentials": True,
-            "storage": "in-memory + S3"
+            "storage": "redis + S3" if REDIS_URL else "in-memory + S3"
         },
-        "videos_tracked": len(video_metadata),
-        "active_sessions": len(active_sessions)
+        "videos_tracked": await video_metadata.count(),
+        "active_sessions": await active_sessions.count()
     }
 
 # ============================================================================
@@ -134,8 +325,8 @@ async def get_video_upload_url(request: VideoUploadRequest):
         
         video_id = str(uuid.uuid4())
         
-        # Store metadata in memory
-        video_metadata[video_id] = {
+        # Store metadata in the shared store
+        await video_metadata.set(video_id, {
             'videoId': video_id,
             'fileName': request.fileName,
             'contentType': request.contentType,
@@ -143,12 +334,13 @@ async def get_video_upload_url(request: VideoUploadRequest):
             's3Key': upload_info['key'],
             'status': 'uploaded',
             'analysisStatus': 'pending',
-            'uploadTime': datetime.utcnow().isoformat()
-        }
-        
+            'uploadTime': _now_iso()
+        })
+
         logger.info(f"Generated upload URL for video {video_id}")
         
-        return VideoUploadResponse(
+        # Server-generated values are already valid; skip validator dispatch
+        return VideoUploadResponse.model_construct(
             uploadUrl=upload_info['upload_url'],
             s3Uri=upload_info['s3_uri'],
             videoId=video_id
@@ -163,24 +355,27 @@ async def get_video_upload_url(request: VideoUploadRequest):
 # ============================================================================
 
 @app.post("/api/video/analyze/{video_id}")
+@app.post("/api/analyze-video/{video_id}")  # old frontend URL
 async def analyze_video(video_id: str, background_tasks: BackgroundTasks):
     """Trigger video analysis using Bedrock Data Automation in background."""
     try:
-        if video_id not in video_metadata:
+        metadata = await video_metadata.get(video_id)
+        if metadata is None:
             raise HTTPException(status_code=404, detail="Video not found")
-        
-        metadata = video_metadata[video_id]
+
         s3_uri = metadata.get('s3Uri')
-        
+
         if not s3_uri:
             raise HTTPException(status_code=400, detail="Video S3 URI not found")
-        
+
         # Update status to processing
-        video_metadata[video_id]['analysisStatus'] = 'processing'
-        video_metadata[video_id]['analysisStartedAt'] = datetime.utcnow().isoformat()
-        
+        await video_metadata.update(video_id, {
+            'analysisStatus': 'processing',
+            'analysisStartedAt': _now_iso()
+        })
+
         # Start analysis in background
-        background_tasks.add_task(process_video_analysis_sync, video_id, s3_uri)
+        background_tasks.add_task(process_video_analysis, video_id, s3_uri)
         
         logger.info(f"Started background analysis for video {video_id}")
         
@@ -202,16 +397,33 @@ async def analyze_video(video_id: str, background_tasks: BackgroundTasks):
 # ============================================================================
 
 @app.get("/api/analysis-status/{video_id}")
-async def get_analysis_status(video_id: str):
+async def get_analysis_status(video_id: str, request: Request, response: Response):
     """Get the status of video analysis and results if completed."""
     try:
-        if video_id not in video_metadata:
+        metadata = await video_metadata.get(video_id)
+        if metadata is None:
             raise HTTPException(status_code=404, detail="Video not found")
-        
-        metadata = video_metadata[video_id]
+
         analysis_status = metadata.get('analysisStatus', 'pending')
-        
-        response = {
+
+        # Status only changes on analysis transitions, so cheap polls can be
+        # answered with 304 instead of re-fetching results from S3
+        etag = hashlib.md5(orjson.dumps({
+            'status': analysis_status,
+            'completed': metadata.get('analysisCompletedAt')
+        })).hexdigest()
+        cache_control = "public, max-age=300" if analysis_status == 'completed' else "public, max-age=2"
+
+        if request.headers.get('if-none-match') == etag:
+            return Response(
+                status_code=304,
+                headers={"ETag": etag, "Cache-Control": cache_control}
+            )
+
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = cache_control
+
+        payload = {
             "videoId": video_id,
             "status": analysis_status,
             "fileName": metadata.get('fileName'),
@@ -219,38 +431,41 @@ async def get_analysis_status(video_id: str):
         }
         
         if analysis_status == 'processing':
-            response['message'] = 'Analysis in progress...'
+            payload['message'] = 'Analysis in progress...'
             if 'analysisStartedAt' in metadata:
-                response['startedAt'] = metadata['analysisStartedAt']
+                payload['startedAt'] = metadata['analysisStartedAt']
         
         elif analysis_status == 'completed':
             # Fetch results from S3
             try:
-                s3_client = get_s3_client()
+                s3_client = S3_CLIENT
                 bucket_name = get_bucket_name()
                 
                 analysis_key = f'analysis/{video_id}/results.json'
-                s3_response = s3_client.get_object(Bucket=bucket_name, Key=analysis_key)
-                results = json.loads(s3_response['Body'].read().decode('utf-8'))
+                s3_response = await asyncio.to_thread(
+                    s3_client.get_object, Bucket=bucket_name, Key=analysis_key
+                )
+                body = await asyncio.to_thread(s3_response['Body'].read)
+                results = orjson.loads(body)
                 
-                response['results'] = results
-                response['completedAt'] = metadata.get('analysisCompletedAt')
-                response['processingDuration'] = metadata.get('processingDuration')
-                response['message'] = 'Analysis completed successfully'
+                payload['results'] = results
+                payload['completedAt'] = metadata.get('analysisCompletedAt')
+                payload['processingDuration'] = metadata.get('processingDuration')
+                payload['message'] = 'Analysis completed successfully'
                 
             except s3_client.exceptions.NoSuchKey:
                 logger.error(f"Results file not found for completed analysis: {video_id}")
-                response['status'] = 'failed'
-                response['message'] = 'Analysis results not found'
+                payload['status'] = 'failed'
+                payload['message'] = 'Analysis results not found'
         
         elif analysis_status == 'failed':
-            response['message'] = metadata.get('errorMessage', 'Analysis failed')
-            response['completedAt'] = metadata.get('analysisCompletedAt')
+            payload['message'] = metadata.get('errorMessage', 'Analysis failed')
+            payload['completedAt'] = metadata.get('analysisCompletedAt')
         
         else:  # pending
-            response['message'] = 'Analysis not started yet'
+            payload['message'] = 'Analysis not started yet'
         
-        return response
+        return payload
         
     except HTTPException:
         raise
@@ -259,15 +474,6 @@ async def get_analysis_status(video_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-# ============================================================================
-# COMPATIBILITY ENDPOINTS (for old frontend)
-# ============================================================================
-
-@app.post("/api/analyze-video/{video_id}")
-async def analyze_video_compat(video_id: str, background_tasks: BackgroundTasks):
-    """Compatibility endpoint for old frontend URL."""
-    return await analyze_video(video_id, background_tasks)
-
 # ============================================================================
 # BEDROCK AGENT ENDPOINTS
 # ============================================================================
@@ -280,16 +486,18 @@ async def start_conversation(request: StartConversationRequest):
         
         # Get S3 URI from video metadata if videoId is provided
         s3_uri = None
-        if request.videoId and request.videoId in video_metadata:
-            s3_uri = video_metadata[request.videoId].get('s3Uri')
-        
-        active_sessions[session_id] = {
+        if request.videoId:
+            metadata = await video_metadata.get(request.videoId)
+            if metadata:
+                s3_uri = metadata.get('s3Uri')
+
+        await active_sessions.set(session_id, {
             "sessionId": session_id,
             "videoId": request.videoId,
             "s3Uri": s3_uri,
-            "createdAt": datetime.utcnow().isoformat(),
+            "createdAt": _now_iso(),
             "messages": []
-        }
+        })
         
         logger.info(f"Started conversation session: {session_id} with video: {request.videoId}")
         
@@ -303,14 +511,14 @@ async def start_conversation(request: StartConversationRequest):
 async def send_message(request: SendMessageRequest):
     """Send a message to the Bedrock Agent with session attributes."""
     try:
-        if request.sessionId not in active_sessions:
+        session = await active_sessions.get(request.sessionId)
+        if session is None:
             raise HTTPException(status_code=404, detail="Session not found")
-        
+
         if not BEDROCK_AGENT_ID:
             raise HTTPException(status_code=500, detail="Bedrock Agent ID not configured")
-        
-        session = active_sessions[request.sessionId]
-        bedrock_agent_runtime = get_bedrock_agent_runtime_client()
+
+        bedrock_agent_runtime = BEDROCK_AGENT_RUNTIME_CLIENT
         
         # Prepare session attributes with S3 URI
         session_state = {}
@@ -325,61 +533,105 @@ async def send_message(request: SendMessageRequest):
         
         # Invoke agent with session attributes
         invoke_params = {
-            'agentId': BEDROCK_AGENT_ID,
-            'agentAliasId': BEDROCK_AGENT_ALIAS_ID,
+            **_BASE_INVOKE_PARAMS,
             'sessionId': request.sessionId,
-            'inputText': request.message,
-            'enableTrace': True,
-            'endSession': False
+            'inputText': request.message
         }
-        
+
         # Add session state if available
         if session_state:
             invoke_params['sessionState'] = session_state
         
-        response = bedrock_agent_runtime.invoke_agent(**invoke_params)
-        
-        # Process streaming response
-        output_text = ""
-        if 'completion' in response:
-            for event in response['completion']:
-                if 'chunk' in event:
-                    chunk = event['chunk']
+        async with _BEDROCK_SEM:
+            response = await asyncio.to_thread(bedrock_agent_runtime.invoke_agent, **invoke_params)
+
+        if request.stream:
+            # Relay agent chunks to the client as they arrive instead of
+            # buffering the full completion. Starlette iterates the sync
+            # generator in a threadpool, so the blocking EventStream read
+            # never touches the event loop.
+            chunks: List[str] = []
+
+            def event_stream():
+                for event in response.get('completion', []):
+                    chunk = event.get('chunk', {})
                     if 'bytes' in chunk:
-                        output_text += chunk['bytes'].decode('utf-8')
-        
-        # Store message in session
-        session['messages'].extend([
-            {
-                "role": "user",
-                "content": request.message,
-                "timestamp": datetime.utcnow().isoformat()
-            },
-            {
-                "role": "assistant", 
-                "content": output_text,
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        ])
-        
+                        text = chunk['bytes'].decode('utf-8', errors='replace')
+                        chunks.append(text)
+                        # One data: line per payload line - an embedded
+                        # newline would otherwise end the SSE event early
+                        yield ''.join(f"data: {line}\n" for line in text.split('\n')) + "\n"
+
+            async def persist_exchange():
+                await _store_message_exchange(session, request.sessionId, request.message, ''.join(chunks))
+
+            return StreamingResponse(
+                event_stream(),
+                media_type='text/event-stream',
+                background=BackgroundTask(persist_exchange)
+            )
+
+        # Buffered path (default, used by the current frontend)
+        output_text = await asyncio.to_thread(_drain_completion, response)
+
+        await _store_message_exchange(session, request.sessionId, request.message, output_text)
+
         return {
             "sessionId": request.sessionId,
             "output": {"text": output_text}
         }
-        
+
     except Exception as e:
         logger.error(f"Failed to send message: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+
+def _drain_completion(response: Dict[str, Any]) -> str:
+    """Collect a Bedrock agent streaming completion into one string.
+
+    Accumulates raw bytes and decodes once at the end so multi-byte UTF-8
+    sequences straddling chunk boundaries can't be split mid-character.
+    """
+    buf = bytearray()
+    for event in response.get('completion', []):
+        chunk = event.get('chunk', {})
+        if 'bytes' in chunk:
+            buf += chunk['bytes']
+    return buf.decode('utf-8', errors='replace')
+
+
+async def _store_message_exchange(session: Dict[str, Any], session_id: str, user_text: str, assistant_text: str):
+    """Append a user/assistant message pair to the session record.
+
+    History is bounded to the newest MAX_SESSION_MESSAGES entries so
+    long-running conversations can't grow session memory without limit.
+    """
+    timestamp = _now_iso()
+    messages = session.get('messages', [])
+    messages.extend([
+        {
+            "role": "user",
+            "content": user_text,
+            "timestamp": timestamp
+        },
+        {
+            "role": "assistant",
+            "content": assistant_text,
+            "timestamp": timestamp
+        }
+    ])
+    if len(messages) > MAX_SESSION_MESSAGES:
+        messages = messages[-MAX_SESSION_MESSAGES:]
+    await active_sessions.update(session_id, {'messages': messages})
+
 @app.post("/api/agent/conversation/end")
 async def end_conversation(request: dict):
     """End a conversation session."""
     session_id = request.get('sessionId')
-    
-    if session_id in active_sessions:
-        del active_sessions[session_id]
+
+    if session_id and await active_sessions.delete(session_id):
         logger.info(f"Ended conversation session: {session_id}")
-    
+
     return {"message": "Conversation ended"}
 
 # ============================================================================
@@ -396,38 +648,62 @@ async def ask_question(request: dict):
         if not video_id or not question:
             raise HTTPException(status_code=400, detail="videoId and question are required")
         
-        if video_id not in video_metadata:
+        metadata = await video_metadata.get(video_id)
+        if metadata is None:
             raise HTTPException(status_code=404, detail="Video not found")
-        
-        metadata = video_metadata[video_id]
-        
+
         if metadata.get('analysisStatus') != 'completed':
             raise HTTPException(status_code=400, detail="Video analysis not completed yet")
         
         # Get analysis results from S3
-        s3_client = get_s3_client()
+        s3_client = S3_CLIENT
         bucket_name = get_bucket_name()
         
         try:
-            analysis_key = f'analysis/{video_id}/results.json'
-            response = s3_client.get_object(Bucket=bucket_name, Key=analysis_key)
-            analysis_data = json.loads(response['Body'].read().decode('utf-8'))
-            
+            # A chat session typically asks many questions about one video;
+            # serve repeats from the in-process cache instead of S3
+            async with _analysis_cache_lock:
+                structured_data = _analysis_cache.get(video_id)
+
+            if structured_data is None:
+                # Prefer the small sections projection written at analysis
+                # time - it avoids downloading the full multi-MB results
+                # object just to pluck four sub-keys
+                try:
+                    sections_key = f'analysis/{video_id}/sections.json'
+                    sections_response = await asyncio.to_thread(
+                        s3_client.get_object, Bucket=bucket_name, Key=sections_key
+                    )
+                    body = await asyncio.to_thread(sections_response['Body'].read)
+                    structured_data = orjson.loads(body)
+                except s3_client.exceptions.NoSuchKey:
+                    # Older analyses only have the full results object
+                    analysis_key = f'analysis/{video_id}/results.json'
+                    response = await asyncio.to_thread(
+                        s3_client.get_object, Bucket=bucket_name, Key=analysis_key
+                    )
+                    body = await asyncio.to_thread(response['Body'].read)
+                    analysis_data = orjson.loads(body)
+
+                    structured_data = {
+                        'game_events': analysis_data.get('customOutput', {}).get('game_events', []),
+                        'player_actions': analysis_data.get('customOutput', {}).get('player_actions', []),
+                        'game_context': analysis_data.get('customOutput', {}).get('game_context', {}),
+                        'metadata': analysis_data.get('standardOutput', {}).get('metadata', {})
+                    }
+
+                async with _analysis_cache_lock:
+                    _analysis_cache[video_id] = structured_data
+
             # Use Bedrock Agent with structured context
             from shared.aws_helpers import invoke_agent_with_structured_context
             
-            structured_data = {
-                'game_events': analysis_data.get('customOutput', {}).get('game_events', []),
-                'player_actions': analysis_data.get('customOutput', {}).get('player_actions', []),
-                'game_context': analysis_data.get('customOutput', {}).get('game_context', {}),
-                'metadata': analysis_data.get('standardOutput', {}).get('metadata', {})
-            }
-            
-            answer_data = await invoke_agent_with_structured_context(
-                question=question,
-                structured_data=structured_data,
-                session_id=request.get('sessionId', str(uuid.uuid4()))
-            )
+            async with _BEDROCK_SEM:
+                answer_data = await invoke_agent_with_structured_context(
+                    question=question,
+                    structured_data=structured_data,
+                    session_id=request.get('sessionId', str(uuid.uuid4()))
+                )
             
             return {
                 "videoId": video_id,
@@ -451,64 +727,87 @@ async def ask_question(request: dict):
 # BACKGROUND TASKS
 # ============================================================================
 
-def process_video_analysis_sync(video_id: str, s3_uri: str):
-    """Synchronous background task to process video analysis."""
-    import asyncio
-    
-    async def _process():
-        try:
-            logger.info(f"Starting analysis for video {video_id}")
-            
-            start_time = datetime.utcnow()
-            raw_results = await invoke_data_automation_and_get_results(s3_uri)
-            end_time = datetime.utcnow()
-            
-            processing_duration = (end_time - start_time).total_seconds()
-            
-            if raw_results:
-                # Extract customOutput - this is what frontend expects
-                # raw_results has format: {standardOutput: {...}, customOutput: {...}}
-                # We only store customOutput which has the processed game data
-                results_to_store = raw_results.get('customOutput', raw_results)
-                
-                # Store results in S3
-                s3_client = get_s3_client()
-                bucket_name = get_bucket_name()
-                
-                analysis_key = f'analysis/{video_id}/results.json'
-                s3_client.put_object(
+async def process_video_analysis(video_id: str, s3_uri: str):
+    """Background task to process video analysis."""
+    try:
+        logger.info(f"Starting analysis for video {video_id}")
+
+        start_time = datetime.now(timezone.utc)
+        raw_results = await invoke_data_automation_and_get_results(s3_uri)
+        end_time = datetime.now(timezone.utc)
+
+        processing_duration = (end_time - start_time).total_seconds()
+
+        if raw_results:
+            # Extract customOutput - this is what frontend expects
+            # raw_results has format: {standardOutput: {...}, customOutput: {...}}
+            # We only store customOutput which has the processed game data
+            results_to_store = raw_results.get('customOutput', raw_results)
+
+            # Store results in S3
+            s3_client = S3_CLIENT
+            bucket_name = get_bucket_name()
+
+            analysis_key = f'analysis/{video_id}/results.json'
+            # The sections object is a small projection of just what
+            # ask_question needs, so Q&A requests never download the full
+            # results object
+            custom_output = raw_results.get('customOutput', {})
+            sections = {
+                'game_events': custom_output.get('game_events', []),
+                'player_actions': custom_output.get('player_actions', []),
+                'game_context': custom_output.get('game_context', {}),
+                'metadata': raw_results.get('standardOutput', {}).get('metadata', {})
+            }
+
+            # Both objects are independent - upload them in parallel
+            await asyncio.gather(
+                asyncio.to_thread(
+                    s3_client.upload_fileobj,
+                    # Compact encoding: indentation roughly doubles the bytes
+                    # held in memory and shipped to S3 for large analyses
+                    io.BytesIO(orjson.dumps(results_to_store)),
+                    bucket_name,
+                    analysis_key,
+                    Config=S3_TRANSFER_CONFIG,
+                    ExtraArgs={'ContentType': 'application/json'}
+                ),
+                asyncio.to_thread(
+                    s3_client.put_object,
                     Bucket=bucket_name,
-                    Key=analysis_key,
-                    Body=json.dumps(results_to_store, indent=2),
+                    Key=f'analysis/{video_id}/sections.json',
+                    Body=orjson.dumps(sections),
                     ContentType='application/json'
                 )
-                
-                # Update metadata
-                video_metadata[video_id].update({
-                    'analysisStatus': 'completed',
-                    'analysisCompletedAt': end_time.isoformat(),
-                    'processingDuration': processing_duration
-                })
-                
-                logger.info(f"Completed analysis for video {video_id} in {processing_duration:.2f}s")
-            else:
-                video_metadata[video_id].update({
-                    'analysisStatus': 'failed',
-                    'analysisCompletedAt': end_time.isoformat(),
-                    'errorMessage': 'Analysis returned no results'
-                })
-                logger.error(f"Analysis failed for video {video_id}: No results")
-            
-        except Exception as e:
-            logger.error(f"Failed to process video analysis: {e}")
-            video_metadata[video_id].update({
+            )
+
+            # Drop any cached sections from a previous analysis of this video
+            async with _analysis_cache_lock:
+                _analysis_cache.pop(video_id, None)
+
+            # Update metadata
+            await video_metadata.update(video_id, {
+                'analysisStatus': 'completed',
+                'analysisCompletedAt': end_time.isoformat(),
+                'processingDuration': processing_duration
+            })
+
+            logger.info(f"Completed analysis for video {video_id} in {processing_duration:.2f}s")
+        else:
+            await video_metadata.update(video_id, {
                 'analysisStatus': 'failed',
-                'analysisCompletedAt': datetime.utcnow().isoformat(),
-                'errorMessage': str(e)
+                'analysisCompletedAt': end_time.isoformat(),
+                'errorMessage': 'Analysis returned no results'
             })
-    
-    # Run the async function in a new event loop
-    asyncio.run(_process())
+            logger.error(f"Analysis failed for video {video_id}: No results")
+
+    except Exception as e:
+        logger.error(f"Failed to process video analysis: {e}")
+        await video_metadata.update(video_id, {
+            'analysisStatus': 'failed',
+            'analysisCompletedAt': _now_iso(),
+            'errorMessage': str(e)
+        })
 
 # ============================================================================
 # MAIN
@@ -516,13 +815,30 @@ def process_video_analysis_sync(video_id: str, s3_uri: str):
 
 if __name__ == "__main__":
     import uvicorn
-    
+
     logger.info("Starting Gameplay Analysis API Server")
-    
-    uvicorn.run(
-        "api_server:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
-    )
+
+    debug = os.environ.get('DEBUG', '').lower() in ('1', 'true', 'yes')
+
+    if debug:
+        # Local development: single worker with auto-reload
+        uvicorn.run(
+            "api_server:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,
+            log_level="info"
+        )
+    else:
+        # Production: C event loop + HTTP parser, one worker per CPU
+        uvicorn.run(
+            "api_server:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=int(os.environ.get('WEB_CONCURRENCY', os.cpu_count() or 1)),
+            loop="uvloop",
+            http="httptools",
+            limit_concurrency=1000,
+            timeout_keep_alive=30,
+            log_level="info"
+        )
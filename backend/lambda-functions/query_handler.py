@@ -3,39 +3,115 @@ Lambda function for Query Interface Action Group.
 Handles natural language queries about analyzed video content.
 """
 
+import heapq
 import json
 import os
 import re
+import time
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
+from operator import itemgetter
 from typing import Dict, Any, List, Optional
 import boto3
+from botocore.config import Config
+
+try:
+    import orjson  # available when bundled in a layer; ~2-5x faster than stdlib
+except ImportError:
+    orjson = None
 
 # Set up logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-# Import shared helpers with fallback
-try:
-    # Try Lambda Layer path first
-    import sys
-    sys.path.append('/opt/python')
-    from aws_helpers import (
-        get_bedrock_agent_runtime_client
-    )
-except ImportError:
-    # Fall back to local import from shared directory
-    from shared.aws_helpers import (
-        get_bedrock_agent_runtime_client
-    )
+# Module-level client and bucket persist across warm Lambda invocations;
+# building a boto3 client loads service models and endpoint resolvers, so
+# pay that once per container instead of per request. The pool is sized
+# for the concurrent fallback probe, keepalive skips TLS re-handshakes on
+# the 2nd+ GET, and adaptive retries back off on 503s instead of sleeping
+# a fixed interval.
+s3_client = boto3.client('s3', config=Config(
+    max_pool_connections=16,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 3}
+))
+_BUCKET = os.environ.get('AWS_BUCKET_NAME')
+
+# Question-routing vocabulary, compiled once per container. Questions are
+# tokenized with _TOKEN_RE and routed by set intersection instead of
+# re-building literal lists and substring-scanning on every invocation.
+_TOKEN_RE = re.compile(r"[a-z']+")
+_GOAL_WORDS = frozenset({'goal', 'goals', 'score', 'scored'})
+_PLAYER_WORDS = frozenset({'player', 'players', 'who'})
+_TIME_WORDS = frozenset({'when', 'time', 'timestamp', 'timestamps'})
+_SUMMARY_WORDS = frozenset({'summary', 'summarize', 'overview'})
+
+# Matches 'HH:MM:SS(.fff)' and 'MM:SS' style timestamps
+_TS_RE = re.compile(r'(?:(\d+):)?(\d+):(\d+)(?:\.(\d+))?')
+
+# Words starting with a capital, 3+ letters - likely player names in a
+# question; the tail allows caps and apostrophes for McDavid, O'Reilly
+# and all-caps spellings
+_CAP_WORD_RE = re.compile(r"\b([A-Z][A-Za-z']{2,})\b")
+
+# Scoring-related action keywords matched in one compiled pass; extend the
+# alternation here as the blueprint vocabulary grows
+_GOAL_ACTION_RE = re.compile(r'goal|scored?|hat[- ]?trick')
+
+# One C-level call unpacking the fields every action loop touches
+_ACTION_FIELDS = itemgetter('player', 'action', 'timestamp', 'description')
+
+
+def _action_fields(action: Dict[str, Any]) -> tuple:
+    """Return (player, action, timestamp, description) for an action,
+    falling back to empty strings for missing keys."""
+    try:
+        return _ACTION_FIELDS(action)
+    except KeyError:
+        return (
+            action.get('player', ''), action.get('action', ''),
+            action.get('timestamp', ''), action.get('description', '')
+        )
+
+
+def _ts_seconds(timestamp: str) -> float:
+    """Parse a timestamp string into seconds; inf when unparseable so
+    malformed entries sort to the end deterministically."""
+    match = _TS_RE.match(timestamp or '')
+    if not match:
+        return float('inf')
+    hours, minutes, seconds, frac = match.groups()
+    total = int(minutes) * 60 + int(seconds)
+    if hours:
+        total += int(hours) * 3600
+    if frac:
+        total += float(f'0.{frac}')
+    return float(total)
+
 
+def _json_loads(data):
+    """Parse JSON from bytes or str, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> str:
+    """Serialize to a compact JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Main Lambda handler for query interface operations.
     """
     try:
-        logger.info(f"Received event: {json.dumps(event)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received event: %s", _json_dumps(event))
         
         # Extract the action group, API path, and HTTP method
         action_group = event.get('actionGroup', '')
@@ -46,49 +122,93 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         session_attributes = event.get('sessionAttributes', {})
         video_id = session_attributes.get('videoId', '')
         
-        logger.info(f"Session attributes: {session_attributes}")
-        logger.info(f"Extracted videoId from session: {video_id}")
-        
-        # Extract parameters from the event
-        parameters = {}
-        if 'parameters' in event:
-            for param in event['parameters']:
-                parameters[param['name']] = param['value']
-        
-        # Extract request body if present - properties is a LIST, not a dict!
-        request_body = {}
-        if 'requestBody' in event and 'content' in event['requestBody']:
-            content = event['requestBody']['content']
-            if 'application/json' in content:
-                # Parse the properties list into a dictionary
-                properties = content['application/json'].get('properties', [])
-                for prop in properties:
-                    if isinstance(prop, dict):
-                        request_body[prop.get('name')] = prop.get('value')
-        
-        # Override videoId from session attributes (more reliable than parameters)
-        if video_id:
-            request_body['videoId'] = video_id
-            parameters['videoId'] = video_id
-        
-        logger.info(f"Parsed request_body: {request_body}")
-        logger.info(f"Parsed parameters: {parameters}")
-        
+        logger.info("Session attributes: %s", session_attributes)
+        logger.info("Extracted videoId from session: %s", video_id)
+        
+        # Each route consumes either the query parameters or the request
+        # body, never both, so parse lazily for whichever handler runs
+        def _params() -> Dict[str, Any]:
+            parameters = {param['name']: param['value'] for param in event.get('parameters', [])}
+            # Override videoId from session attributes (more reliable than parameters)
+            if video_id:
+                parameters['videoId'] = video_id
+            logger.info("Parsed parameters: %s", parameters)
+            return parameters
+
+        def _body() -> Dict[str, Any]:
+            # properties is a LIST, not a dict!
+            request_body = {}
+            if 'requestBody' in event and 'content' in event['requestBody']:
+                content = event['requestBody']['content']
+                if 'application/json' in content:
+                    for prop in content['application/json'].get('properties', []):
+                        if isinstance(prop, dict):
+                            request_body[prop.get('name')] = prop.get('value')
+            if video_id:
+                request_body['videoId'] = video_id
+            logger.info("Parsed request_body: %s", request_body)
+            return request_body
+
         # Route to appropriate handler based on API path
         if api_path == '/ask-question' and http_method == 'POST':
-            return handle_ask_question(request_body, api_path, http_method, event)
+            return handle_ask_question(_body(), api_path, http_method, event)
         elif api_path == '/get-video-summary' and http_method == 'GET':
-            return handle_get_video_summary(parameters, api_path, http_method, event)
+            return handle_get_video_summary(_params(), api_path, http_method, event)
         elif api_path == '/search-content' and http_method == 'POST':
-            return handle_search_content(request_body, api_path, http_method, event)
+            return handle_search_content(_body(), api_path, http_method, event)
         else:
             return create_error_response(f"Unknown API path: {api_path}", api_path, http_method)
             
     except Exception as e:
-        logger.error(f"Error in lambda_handler: {str(e)}", exc_info=True)
+        logger.error("Error in lambda_handler: %s", e, exc_info=True)
         return create_error_response(str(e), event.get('apiPath', ''), event.get('httpMethod', ''))
 
 
+# Chapter fields the Agent actually uses when answering questions
+_AGENT_CHAPTER_FIELDS = (
+    'title', 'start_timestamp', 'end_timestamp',
+    'player_actions', 'game_events', 'spectator_reactions', 'locker_room'
+)
+_AGENT_MAX_ACTIONS = 20
+
+
+def _project_for_agent(analysis_results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Project the analysis blob down to a compact view for the Agent.
+
+    Keeps the blueprint match, the overall inference result, and the
+    chapter fields listed in _AGENT_CHAPTER_FIELDS, truncating each
+    chapter's player_actions to the highest-confidence entries. Falls
+    back to the full blob when none of the known keys are present.
+    """
+    projected: Dict[str, Any] = {}
+
+    for key in ('matched_blueprint', 'inference_result'):
+        if key in analysis_results:
+            projected[key] = analysis_results[key]
+
+    chapters = analysis_results.get('chapters')
+    if isinstance(chapters, list):
+        projected_chapters = []
+        for chapter in chapters:
+            view = {field: chapter[field] for field in _AGENT_CHAPTER_FIELDS if field in chapter}
+            actions = view.get('player_actions')
+            if isinstance(actions, list) and len(actions) > _AGENT_MAX_ACTIONS:
+                view['player_actions'] = heapq.nlargest(
+                    _AGENT_MAX_ACTIONS, actions,
+                    key=lambda a: a.get('confidence', 0.0)
+                )
+            projected_chapters.append(view)
+        projected['chapters'] = projected_chapters
+
+    if not projected:
+        # Unknown layout (e.g. legacy customOutput/standardOutput blobs):
+        # pass it through untouched minus the internal search index
+        return {k: v for k, v in analysis_results.items() if k != '_idx'}
+
+    return projected
+
+
 def handle_ask_question(request_body: Dict[str, Any], api_path: str, http_method: str, event: Dict[str, Any] = None) -> Dict[str, Any]:
     """
     Process natural language questions about video content.
@@ -107,14 +227,12 @@ def handle_ask_question(request_body: Dict[str, Any], api_path: str, http_method
         if not analysis_results:
             return create_error_response(f"No analysis results found for video {video_id}", api_path, http_method)
         
-        logger.info(f"Retrieved analysis data with {len(str(analysis_results))} characters")
-        
-        # Simply return the full analysis data - let the Bedrock Agent (LLM) parse it intelligently
-        # The Agent can understand the JSON structure and extract relevant information
+        # Project to the fields the Agent actually reads - raw frame-level
+        # data would otherwise dominate the (256 KB capped) response body
         response_body = {
             'videoId': video_id,
             'question': question,
-            'analysisData': analysis_results,
+            'analysisData': _project_for_agent(analysis_results),
             'message': 'Analysis data retrieved successfully. The Agent will process this data to answer your question.',
             'dataStructure': {
                 'matched_blueprint': 'Blueprint information and confidence score',
@@ -126,7 +244,7 @@ def handle_ask_question(request_body: Dict[str, Any], api_path: str, http_method
         return create_success_response(response_body, api_path, http_method)
         
     except Exception as e:
-        logger.error(f"Error in handle_ask_question: {str(e)}")
+        logger.error("Error in handle_ask_question: %s", e)
         return create_error_response(str(e), api_path, http_method)
 
 
@@ -163,7 +281,7 @@ def handle_get_video_summary(parameters: Dict[str, Any], api_path: str, http_met
         return create_success_response(response_body, api_path, http_method)
         
     except Exception as e:
-        logger.error(f"Error in handle_get_video_summary: {str(e)}")
+        logger.error("Error in handle_get_video_summary: %s", e)
         return create_error_response(str(e), api_path, http_method)
 
 
@@ -205,7 +323,7 @@ def handle_search_content(request_body: Dict[str, Any], api_path: str, http_meth
         return create_success_response(response_body, api_path, http_method)
         
     except Exception as e:
-        logger.error(f"Error in handle_search_content: {str(e)}")
+        logger.error("Error in handle_search_content: %s", e)
         return create_error_response(str(e), api_path, http_method)
 
 
@@ -228,21 +346,22 @@ def process_question_with_analysis(
             'sources': []
         }
         
-        # Normalize question for analysis
+        # Normalize and tokenize the question once
         question_lower = question.lower()
-        
+        tokens = frozenset(_TOKEN_RE.findall(question_lower))
+
         # Extract relevant data from analysis results
         custom_output = analysis_results.get('customOutput', {})
         standard_output = analysis_results.get('standardOutput', {})
-        
+
         # Question type detection and processing
-        if any(word in question_lower for word in ['goal', 'score', 'scored']):
+        if tokens & _GOAL_WORDS:
             answer_data = process_goal_question(question, custom_output, standard_output)
-        elif any(word in question_lower for word in ['player', 'who']):
+        elif tokens & _PLAYER_WORDS:
             answer_data = process_player_question(question, custom_output, standard_output)
-        elif any(word in question_lower for word in ['when', 'time', 'timestamp']):
+        elif tokens & _TIME_WORDS:
             answer_data = process_time_question(question, custom_output, standard_output)
-        elif any(word in question_lower for word in ['summary', 'what happened', 'overview']):
+        elif tokens & _SUMMARY_WORDS or 'what happened' in question_lower:
             answer_data = process_summary_question(question, custom_output, standard_output)
         else:
             # General question processing
@@ -257,7 +376,7 @@ def process_question_with_analysis(
         return answer_data
         
     except Exception as e:
-        logger.error(f"Error processing question: {str(e)}")
+        logger.error("Error processing question: %s", e)
         return {
             'answer': 'I encountered an error while processing your question.',
             'confidence': 0.0,
@@ -277,25 +396,24 @@ def process_goal_question(question: str, custom_output: Dict, standard_output: D
         'sources': ['custom_analysis']
     }
     
-    goals = []
-    if 'player_actions' in custom_output:
-        for action in custom_output['player_actions']:
-            if 'goal' in action.get('action', '').lower():
-                goals.append(action)
-                answer_data['players'].append(action.get('player', ''))
-                answer_data['timestamps'].append({
-                    'timestamp': action.get('timestamp', ''),
-                    'description': f"{action.get('player', '')} scored",
-                    'relevance': 1.0
-                })
-    
-    if goals:
-        goal_descriptions = []
-        for goal in goals:
-            player = goal.get('player', 'Unknown player')
-            timestamp = goal.get('timestamp', 'Unknown time')
-            goal_descriptions.append(f"{player} scored at {timestamp}")
-        
+    goal_descriptions = []
+    seen_players = set()
+    for action in custom_output.get('player_actions', []):
+        player, action_type, timestamp, _ = _action_fields(action)
+        if _GOAL_ACTION_RE.search(action_type.lower()):
+            if player not in seen_players:
+                seen_players.add(player)
+                answer_data['players'].append(player)
+            answer_data['timestamps'].append({
+                'timestamp': timestamp,
+                'description': f"{player} scored",
+                'relevance': 1.0
+            })
+            goal_descriptions.append(
+                f"{player or 'Unknown player'} scored at {timestamp or 'Unknown time'}"
+            )
+
+    if goal_descriptions:
         answer_data['answer'] = f"Goals in this video: {'; '.join(goal_descriptions)}"
     else:
         answer_data['answer'] = "No goals were detected in this video analysis."
@@ -314,37 +432,30 @@ def process_player_question(question: str, custom_output: Dict, standard_output:
         'sources': ['custom_analysis']
     }
     
-    # Extract player names from the question
-    question_words = question.split()
-    potential_players = []
-    
-    # Look for capitalized words that might be player names
-    for word in question_words:
-        if word[0].isupper() and len(word) > 2:
-            potential_players.append(word)
-    
-    player_actions = []
-    if 'player_actions' in custom_output:
+    # Extract capitalized words that might be player names; the regex
+    # also drops attached punctuation that str.split() would keep, and
+    # everything is lowercased once up front
+    potential_players = [name.lower() for name in _CAP_WORD_RE.findall(question)]
+
+    action_descriptions = []
+    seen_players = set()
+    if potential_players and 'player_actions' in custom_output:
         for action in custom_output['player_actions']:
-            player_name = action.get('player', '')
+            player_name, action_type, timestamp, _ = _action_fields(action)
+            player_lower = player_name.lower()
             # Check if any potential player names match
-            if any(name.lower() in player_name.lower() for name in potential_players):
-                player_actions.append(action)
-                answer_data['players'].append(player_name)
+            if any(name in player_lower for name in potential_players):
+                if player_name not in seen_players:
+                    seen_players.add(player_name)
+                    answer_data['players'].append(player_name)
                 answer_data['timestamps'].append({
-                    'timestamp': action.get('timestamp', ''),
-                    'description': f"{player_name} {action.get('action', '')}",
+                    'timestamp': timestamp,
+                    'description': f"{player_name} {action_type}",
                     'relevance': 0.9
                 })
-    
-    if player_actions:
-        action_descriptions = []
-        for action in player_actions:
-            player = action.get('player', '')
-            action_type = action.get('action', '')
-            timestamp = action.get('timestamp', '')
-            action_descriptions.append(f"{player} {action_type} at {timestamp}")
-        
+                action_descriptions.append(f"{player_name} {action_type} at {timestamp}")
+
+    if action_descriptions:
         answer_data['answer'] = f"Player actions found: {'; '.join(action_descriptions)}"
     else:
         answer_data['answer'] = "No specific player actions found matching your query."
@@ -366,30 +477,37 @@ def process_time_question(question: str, custom_output: Dict, standard_output: D
     # Collect all timestamped events
     events = []
     
-    # From custom output
+    # From custom output; the sort key is parsed once per event rather
+    # than string-comparing raw timestamps (which misorders mixed
+    # HH:MM:SS and MM:SS formats) on every comparison
     if 'player_actions' in custom_output:
         for action in custom_output['player_actions']:
+            timestamp = action.get('timestamp', '')
             events.append({
-                'timestamp': action.get('timestamp', ''),
+                'timestamp': timestamp,
                 'description': f"{action.get('player', '')} {action.get('action', '')}",
-                'type': 'player_action'
+                'type': 'player_action',
+                '_sort_key': _ts_seconds(timestamp)
             })
-    
+
     # From standard output
     if 'chapters' in standard_output:
         for chapter in standard_output['chapters']:
+            timestamp = chapter.get('start_timestamp', '')
             events.append({
-                'timestamp': chapter.get('start_timestamp', ''),
+                'timestamp': timestamp,
                 'description': chapter.get('title', ''),
-                'type': 'chapter'
+                'type': 'chapter',
+                '_sort_key': _ts_seconds(timestamp)
             })
-    
-    # Sort events by timestamp
-    events.sort(key=lambda x: x['timestamp'])
-    
+
+    # Only the five earliest events are reported, so a bounded heap
+    # selection beats sorting the whole list
+    events = heapq.nsmallest(5, events, key=itemgetter('_sort_key'))
+
     if events:
         event_descriptions = []
-        for event in events[:5]:  # Limit to first 5 events
+        for event in events:
             event_descriptions.append(f"{event['timestamp']}: {event['description']}")
             answer_data['timestamps'].append({
                 'timestamp': event['timestamp'],
@@ -427,13 +545,15 @@ def process_summary_question(question: str, custom_output: Dict, standard_output
     
     # Key player actions
     if 'player_actions' in custom_output:
-        actions = custom_output['player_actions'][:3]  # Top 3 actions
-        for action in actions:
+        seen_players = set()
+        for action in islice(custom_output['player_actions'], 3):  # Top 3 actions
             player = action.get('player', '')
             action_type = action.get('action', '')
             timestamp = action.get('timestamp', '')
             summary_parts.append(f"{player} {action_type} at {timestamp}")
-            answer_data['players'].append(player)
+            if player not in seen_players:
+                seen_players.add(player)
+                answer_data['players'].append(player)
             answer_data['timestamps'].append({
                 'timestamp': timestamp,
                 'description': f"{player} {action_type}",
@@ -467,14 +587,18 @@ def process_general_question(question: str, custom_output: Dict, standard_output
     question_keywords = set(question.lower().split())
     
     # Search through custom output
+    seen_players = set()
     if 'player_actions' in custom_output:
         for action in custom_output['player_actions']:
-            action_text = f"{action.get('player', '')} {action.get('action', '')} {action.get('description', '')}".lower()
+            player, action_type, timestamp, description = _action_fields(action)
+            action_text = f"{player} {action_type} {description}".lower()
             if any(keyword in action_text for keyword in question_keywords):
-                answer_data['players'].append(action.get('player', ''))
+                if player not in seen_players:
+                    seen_players.add(player)
+                    answer_data['players'].append(player)
                 answer_data['timestamps'].append({
-                    'timestamp': action.get('timestamp', ''),
-                    'description': f"{action.get('player', '')} {action.get('action', '')}",
+                    'timestamp': timestamp,
+                    'description': f"{player} {action_type}",
                     'relevance': 0.7
                 })
     
@@ -511,7 +635,7 @@ def generate_comprehensive_summary(analysis_results: Dict[str, Any], summary_typ
         summary_parts.append(f"Analysis identified {action_count} key player actions")
         
         # Extract key moments
-        for action in custom_output['player_actions'][:5]:
+        for action in islice(custom_output['player_actions'], 5):
             summary_data['key_moments'].append({
                 'timestamp': action.get('timestamp', ''),
                 'event': action.get('action', ''),
@@ -525,103 +649,120 @@ def generate_comprehensive_summary(analysis_results: Dict[str, Any], summary_typ
     
     summary_data['summary'] = '. '.join(summary_parts) if summary_parts else 'Video analysis completed successfully.'
     
-    # Generate player stats
-    if 'player_actions' in custom_output:
-        player_counts = {}
-        for action in custom_output['player_actions']:
-            player = action.get('player', 'Unknown')
-            if player not in player_counts:
-                player_counts[player] = 0
-            player_counts[player] += 1
-        summary_data['player_stats'] = player_counts
-    
+    # Generate player stats; a brief summary doesn't include them, so
+    # skip the full action scan for that path
+    if summary_type != 'brief' and 'player_actions' in custom_output:
+        summary_data['player_stats'] = dict(Counter(
+            action.get('player', 'Unknown') for action in custom_output['player_actions']
+        ))
+
     return summary_data
 
 
+def _build_search_index(custom_output: Dict[str, Any], standard_output: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build an inverted index over the searchable analysis entries.
+
+    Tokenizes every player action and transcript entry once and maps each
+    token to the indexes of the entries containing it, so a query only
+    scores the candidate entries its tokens actually appear in rather
+    than re-splitting every text per query.
+    """
+    docs: List[str] = []       # lowercased searchable text per entry
+    entries: List[tuple] = []  # (entry type, source dict)
+    postings: Dict[str, List[int]] = {}
+
+    def _add(doc_text: str, entry_type: str, source: Dict[str, Any]) -> None:
+        idx = len(docs)
+        docs.append(doc_text)
+        entries.append((entry_type, source))
+        for token in set(_TOKEN_RE.findall(doc_text)):
+            postings.setdefault(token, []).append(idx)
+
+    for action in custom_output.get('player_actions', []):
+        player, action_type, _, description = _action_fields(action)
+        _add(f"{player} {action_type} {description}".lower(), 'player_action', action)
+
+    transcript = standard_output.get('transcript')
+    if isinstance(transcript, list):
+        for entry in transcript:
+            _add(entry.get('text', '').lower(), 'dialogue', entry)
+
+    return {'docs': docs, 'entries': entries, 'postings': postings}
+
+
 def search_video_content(
-    analysis_results: Dict[str, Any], 
-    search_query: str, 
-    search_type: str, 
+    analysis_results: Dict[str, Any],
+    search_query: str,
+    search_type: str,
     time_range: Dict[str, str]
 ) -> Dict[str, Any]:
     """Search for specific content within the video analysis."""
-    start_time = datetime.now()
-    
+    t0 = time.perf_counter()
+
     results = []
     search_terms = search_query.lower().split()
-    
+
     custom_output = analysis_results.get('customOutput', {})
     standard_output = analysis_results.get('standardOutput', {})
-    
-    # Search player actions
-    if search_type in ['players', 'all'] and 'player_actions' in custom_output:
-        for action in custom_output['player_actions']:
-            action_text = f"{action.get('player', '')} {action.get('action', '')} {action.get('description', '')}".lower()
-            relevance = calculate_relevance(action_text, search_terms)
-            
-            if relevance > 0.3:  # Threshold for relevance
+
+    # The index is cached on the analysis dict itself, so repeat searches
+    # against the same blob within a warm container skip the build
+    index = analysis_results.get('_idx')
+    if index is None:
+        index = _build_search_index(custom_output, standard_output)
+        analysis_results['_idx'] = index
+
+    # Gather candidates: count how many distinct query tokens hit each entry
+    matched_counts: Dict[int, int] = {}
+    for term in set(search_terms):
+        for idx in index['postings'].get(term, ()):
+            matched_counts[idx] = matched_counts.get(idx, 0) + 1
+
+    phrase = ' '.join(search_terms)
+    wanted_type = {'players': 'player_action', 'dialogue': 'dialogue'}.get(search_type)
+
+    for idx, matched in matched_counts.items():
+        entry_type, source = index['entries'][idx]
+        if wanted_type is not None and entry_type != wanted_type:
+            continue
+
+        relevance = matched / len(search_terms)
+        # Boost relevance for exact phrase matches
+        if phrase in index['docs'][idx]:
+            relevance += 0.3
+        relevance = min(relevance, 1.0)
+
+        if relevance > 0.3:  # Threshold for relevance
+            if entry_type == 'player_action':
                 results.append({
-                    'timestamp': action.get('timestamp', ''),
+                    'timestamp': source.get('timestamp', ''),
                     'type': 'player_action',
-                    'content': f"{action.get('player', '')} {action.get('action', '')}",
+                    'content': f"{source.get('player', '')} {source.get('action', '')}",
                     'relevanceScore': relevance,
-                    'context': action.get('description', '')
+                    'context': source.get('description', '')
                 })
-    
-    # Search dialogue/transcript
-    if search_type in ['dialogue', 'all'] and 'transcript' in standard_output:
-        transcript = standard_output['transcript']
-        if isinstance(transcript, list):
-            for entry in transcript:
-                text = entry.get('text', '').lower()
-                relevance = calculate_relevance(text, search_terms)
-                
-                if relevance > 0.3:
-                    results.append({
-                        'timestamp': entry.get('timestamp', ''),
-                        'type': 'dialogue',
-                        'content': entry.get('text', ''),
-                        'relevanceScore': relevance,
-                        'context': f"Speaker: {entry.get('speaker', 'Unknown')}"
-                    })
-    
-    # Sort results by relevance
-    results.sort(key=lambda x: x['relevanceScore'], reverse=True)
-    
-    end_time = datetime.now()
-    search_time = str(end_time - start_time)
-    
+            else:
+                results.append({
+                    'timestamp': source.get('timestamp', ''),
+                    'type': 'dialogue',
+                    'content': source.get('text', ''),
+                    'relevanceScore': relevance,
+                    'context': f"Speaker: {source.get('speaker', 'Unknown')}"
+                })
+
+    # Top-20 selection without sorting the full result list
+    top_results = heapq.nlargest(20, results, key=itemgetter('relevanceScore'))
+
+    elapsed = time.perf_counter() - t0
+
     return {
-        'results': results[:20],  # Limit to top 20 results
+        'results': top_results,
         'total': len(results),
-        'search_time': search_time
+        'search_time': f"{elapsed:.3f}s"
     }
 
 
-def calculate_relevance(text: str, search_terms: List[str]) -> float:
-    """Calculate relevance score between text and search terms."""
-    if not text or not search_terms:
-        return 0.0
-    
-    text_words = set(text.lower().split())
-    search_words = set(search_terms)
-    
-    # Calculate intersection
-    common_words = text_words.intersection(search_words)
-    
-    if not common_words:
-        return 0.0
-    
-    # Simple relevance calculation
-    relevance = len(common_words) / len(search_words)
-    
-    # Boost relevance for exact phrase matches
-    if ' '.join(search_terms) in text:
-        relevance += 0.3
-    
-    return min(relevance, 1.0)
-
-
 def summarize_answer(answer: str) -> str:
     """Create a brief summary of a detailed answer."""
     sentences = answer.split('.')
@@ -647,23 +788,82 @@ def format_answer_with_timestamps(answer_data: Dict[str, Any]) -> str:
     return f"{base_answer}\n\nKey timestamps: {'; '.join(timestamp_info)}"
 
 
+# Parsed analyses cached across warm invocations: agent conversations ask
+# several questions about the same video back-to-back, and each was paying
+# a fresh S3 GET plus a full JSON parse
+_ANALYSIS_CACHE: Dict[str, tuple] = {}  # video_id -> (expiry, analysis dict)
+_ANALYSIS_CACHE_TTL = 300.0
+_ANALYSIS_CACHE_MAX = 8
+
+
 def get_analysis_from_db(video_id: str) -> Dict[str, Any]:
-    """Retrieve analysis results from S3."""
+    """Retrieve analysis results from S3, serving warm repeats from cache."""
+    now = time.monotonic()
+    cached = _ANALYSIS_CACHE.get(video_id)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
     try:
         # Get analysis results directly from S3
-        return get_analysis_from_s3_direct(video_id)
-        
+        analysis_results = get_analysis_from_s3_direct(video_id)
+
     except Exception as e:
-        logger.error(f"Error retrieving analysis from S3: {str(e)}")
+        logger.error("Error retrieving analysis from S3: %s", e)
         return {}
 
+    if analysis_results:
+        if len(_ANALYSIS_CACHE) >= _ANALYSIS_CACHE_MAX:
+            _ANALYSIS_CACHE.pop(next(iter(_ANALYSIS_CACHE)))
+        _ANALYSIS_CACHE[video_id] = (now + _ANALYSIS_CACHE_TTL, analysis_results)
+
+    return analysis_results
+
+
+# Legacy result locations, in order of likelihood. Once a video is found
+# under one of them the winning template is remembered for the rest of
+# the container, so later lookups skip the miss round-trips entirely.
+_FALLBACK_TEMPLATES = (
+    "analysis-results/{video_id}/results.json",
+    "data-automation-results/{video_id}/results.json",
+    "results/{video_id}/results.json"
+)
+_last_good_template: Optional[str] = None
+
+# Small shared pool for concurrent fallback probing; boto3 clients are
+# thread-safe and the pool outlives the invocation in a warm container
+_PROBE_POOL = ThreadPoolExecutor(max_workers=4)
+
+
+def _probe_fallback_paths(bucket_name: str, video_id: str) -> Optional[tuple]:
+    """
+    Fetch all legacy result locations concurrently and return the first
+    hit as (template, path, parsed analysis), or None when every probe
+    misses. Results are consumed in template-priority order, so the
+    outcome is deterministic even though the GETs run in parallel.
+    """
+    def _fetch(template: str) -> Optional[tuple]:
+        path = template.format(video_id=video_id)
+        try:
+            response = s3_client.get_object(Bucket=bucket_name, Key=path)
+            return template, path, _json_loads(response['Body'].read())
+        except s3_client.exceptions.NoSuchKey:
+            return None
+        except Exception as e:
+            logger.warning("Error reading %s: %s", path, e)
+            return None
+
+    for result in _PROBE_POOL.map(_fetch, _FALLBACK_TEMPLATES):
+        if result is not None:
+            return result
+    return None
+
 
 def get_analysis_from_s3_direct(video_id: str) -> Dict[str, Any]:
     """Directly retrieve analysis results from S3 using video ID."""
+    global _last_good_template
     try:
-        s3_client = boto3.client('s3')
-        bucket_name = os.environ.get('AWS_BUCKET_NAME')
-        
+        bucket_name = _BUCKET
+
         # Validate bucket name
         if not bucket_name:
             error_msg = "AWS_BUCKET_NAME environment variable is not set in Lambda configuration"
@@ -671,61 +871,58 @@ def get_analysis_from_s3_direct(video_id: str) -> Dict[str, Any]:
             logger.error("Please add AWS_BUCKET_NAME to Lambda environment variables")
             logger.error("Example: AWS_BUCKET_NAME=gameplay-analysis-videos-1760846170")
             raise ValueError(error_msg)
-        
-        logger.info(f"Using S3 bucket: {bucket_name}")
-        
+
+        logger.info("Using S3 bucket: %s", bucket_name)
+
         # PRIMARY PATH - where api_server.py stores the combined results
         # This matches the path used in api_server.py: f'analysis/{video_id}/results.json'
         primary_path = f'analysis/{video_id}/results.json'
-        
+
         try:
-            logger.info(f"Attempting to retrieve analysis from primary path: {primary_path}")
+            logger.info("Attempting to retrieve analysis from primary path: %s", primary_path)
             response = s3_client.get_object(Bucket=bucket_name, Key=primary_path)
-            content = response['Body'].read().decode('utf-8')
-            analysis_data = json.loads(content)
-            
-            logger.info(f"Successfully retrieved analysis from {primary_path}")
+            # json.loads accepts bytes directly; skip the intermediate str
+            analysis_data = _json_loads(response['Body'].read())
+
+            logger.info("Successfully retrieved analysis from %s", primary_path)
             return analysis_data
-            
+
         except s3_client.exceptions.NoSuchKey:
-            logger.warning(f"Analysis not found at primary path: {primary_path}")
-            
-            # FALLBACK - try legacy/alternative paths for backward compatibility
-            fallback_paths = [
-                f"analysis-results/{video_id}/results.json",
-                f"data-automation-results/{video_id}/results.json",
-                f"results/{video_id}/results.json"
-            ]
-            
-            for path in fallback_paths:
+            logger.warning("Analysis not found at primary path: %s", primary_path)
+
+            # Fast path: the template that worked last time costs one GET
+            if _last_good_template is not None:
+                path = _last_good_template.format(video_id=video_id)
                 try:
-                    logger.info(f"Trying fallback path: {path}")
                     response = s3_client.get_object(Bucket=bucket_name, Key=path)
-                    content = response['Body'].read().decode('utf-8')
-                    analysis_data = json.loads(content)
-                    logger.info(f"Found analysis at fallback path: {path}")
+                    analysis_data = _json_loads(response['Body'].read())
+                    logger.info("Found analysis at fallback path: %s", path)
                     return analysis_data
                 except s3_client.exceptions.NoSuchKey:
-                    continue
-                except Exception as e:
-                    logger.warning(f"Error reading {path}: {str(e)}")
-                    continue
-            
-            logger.error(f"Analysis not found for video {video_id} in any known location")
-            logger.error(f"Searched paths: {primary_path}, {', '.join(fallback_paths)}")
+                    pass
+
+            # FALLBACK - probe the legacy paths concurrently; each miss
+            # costs a full round-trip, so sequential probing pays ~N x RTT
+            hit = _probe_fallback_paths(bucket_name, video_id)
+            if hit is not None:
+                template, path, analysis_data = hit
+                _last_good_template = template
+                logger.info("Found analysis at fallback path: %s", path)
+                return analysis_data
+
+            logger.error("Analysis not found for video %s in any known location", video_id)
             return {}
-        
+
     except Exception as e:
-        logger.error(f"Error retrieving analysis from S3: {str(e)}")
+        logger.error("Error retrieving analysis from S3: %s", e)
         return {}
 
 
 def get_analysis_results_from_s3(metadata: Dict[str, Any]) -> Dict[str, Any]:
     """Retrieve analysis results from S3 using metadata."""
     try:
-        s3_client = boto3.client('s3')
-        bucket_name = os.environ.get('AWS_BUCKET_NAME')
-        
+        bucket_name = _BUCKET
+
         analysis_data = {}
         
         # Get S3 paths from metadata
@@ -735,60 +932,49 @@ def get_analysis_results_from_s3(metadata: Dict[str, Any]) -> Dict[str, Any]:
         try:
             custom_key = f"{output_s3_prefix}custom_output.json"
             response = s3_client.get_object(Bucket=bucket_name, Key=custom_key)
-            content = response['Body'].read().decode('utf-8')
-            analysis_data['customOutput'] = json.loads(content)
+            analysis_data['customOutput'] = _json_loads(response['Body'].read())
         except Exception as e:
-            logger.warning(f"Could not retrieve custom output: {str(e)}")
+            logger.warning("Could not retrieve custom output: %s", e)
         
         # Try to get standard output
         try:
             standard_key = f"{output_s3_prefix}standard_output.json"
             response = s3_client.get_object(Bucket=bucket_name, Key=standard_key)
-            content = response['Body'].read().decode('utf-8')
-            analysis_data['standardOutput'] = json.loads(content)
+            analysis_data['standardOutput'] = _json_loads(response['Body'].read())
         except Exception as e:
-            logger.warning(f"Could not retrieve standard output: {str(e)}")
+            logger.warning("Could not retrieve standard output: %s", e)
         
         return analysis_data
         
     except Exception as e:
-        logger.error(f"Error retrieving analysis results from S3: {str(e)}")
+        logger.error("Error retrieving analysis results from S3: %s", e)
         return {}
 
 
-def create_success_response(body: Dict[str, Any], api_path: str = '', http_method: str = '') -> Dict[str, Any]:
-    """Create a successful response for Bedrock Agent."""
+def _agent_response(api_path: str, http_method: str, status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the Bedrock Agent response envelope shared by success and
+    error paths; only the status code and serialized body differ."""
     return {
         'messageVersion': '1.0',
         'response': {
             'actionGroup': 'QueryInterface',
             'apiPath': api_path,
             'httpMethod': http_method,
-            'httpStatusCode': 200,
+            'httpStatusCode': status_code,
             'responseBody': {
                 'application/json': {
-                    'body': json.dumps(body)
+                    'body': _json_dumps(body)
                 }
             }
         }
     }
 
 
+def create_success_response(body: Dict[str, Any], api_path: str = '', http_method: str = '') -> Dict[str, Any]:
+    """Create a successful response for Bedrock Agent."""
+    return _agent_response(api_path, http_method, 200, body)
+
+
 def create_error_response(error_message: str, api_path: str = '', http_method: str = '') -> Dict[str, Any]:
     """Create an error response for Bedrock Agent."""
-    return {
-        'messageVersion': '1.0',
-        'response': {
-            'actionGroup': 'QueryInterface',
-            'apiPath': api_path,
-            'httpMethod': http_method,
-            'httpStatusCode': 400,
-            'responseBody': {
-                'application/json': {
-                    'body': json.dumps({
-                        'error': error_message
-                    })
-                }
-            }
-        }
-    }
+    return _agent_response(api_path, http_method, 400, {'error': error_message})
@@ -3,18 +3,66 @@ Lambda function for Video Management Action Group.
 Handles video upload, storage, and inventory management.
 """
 
+import asyncio
+import gzip
 import json
 import os
-import uuid
 import logging
-from datetime import datetime
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Tuple
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+# orjson is bundled with the Lambda layer; fall back to stdlib json so the
+# function still works when invoked outside the packaged environment
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
 
 # Set up logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Module-level client and bucket persist across warm Lambda invocations;
+# client construction resolves credentials and loads service models, so
+# pay for it once per container instead of per call
+s3_client = boto3.client('s3', config=Config(
+    connect_timeout=3,
+    read_timeout=10,
+    tcp_keepalive=True,
+    # Pool must cover the 16-thread metadata fan-out or the extra workers
+    # pay a fresh TLS handshake per request
+    max_pool_connections=32,
+    retries={'mode': 'adaptive', 'max_attempts': 3}
+))
+_BUCKET = os.environ.get('AWS_BUCKET_NAME')
+
+# Botocore builds modeled exception classes lazily; resolve this one once
+# instead of walking client.exceptions on every cache miss
+_NoSuchKey = s3_client.exceptions.NoSuchKey
+
+# Aggregate listing index: one object mapping videoId to the fields the
+# list endpoint needs, so /list-videos is a single GET instead of a scan
+_INDEX_KEY = 'metadata/videos/_index.json'
+
 # Import shared helpers with fallback
 try:
     # Try Lambda Layer path first
@@ -33,13 +81,27 @@ except ImportError:
         get_bucket_name
     )
 
+# One event loop reused across warm invocations; asyncio.run would create
+# and tear down a fresh loop (and its default executor) on every call
+_EVENT_LOOP = asyncio.new_event_loop()
+
+
+def _presign_upload(file_name: str, content_type: str) -> Dict[str, str]:
+    """Run the async shared presigner to completion from this sync handler."""
+    return _EVENT_LOOP.run_until_complete(
+        generate_presigned_upload_url(file_name, content_type)
+    )
+
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Main Lambda handler for video management operations.
     """
     try:
-        logger.info(f"Received event: {json.dumps(event)}")
+        # Serializing the full event is costly for large payloads, so only
+        # do it when debug logging is actually enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received event: %s", _json_dumps(event))
         
         # Extract the action group, API path, and HTTP method
         action_group = event.get('actionGroup', '')
@@ -52,25 +114,29 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             for param in event['parameters']:
                 parameters[param['name']] = param['value']
         
-        # Extract request body if present
-        request_body = {}
-        if 'requestBody' in event and 'content' in event['requestBody']:
-            content = event['requestBody']['content']
-            if 'application/json' in content:
-                request_body = json.loads(content['application/json']['properties'])
+        # Extract request body if present; Bedrock Agents deliver
+        # properties as a name/value list or an already-parsed dict, so
+        # only fall back to JSON parsing for string payloads
+        props = event.get('requestBody', {}).get('content', {}).get('application/json', {}).get('properties')
+        if isinstance(props, list):
+            request_body = {p['name']: p['value'] for p in props}
+        elif isinstance(props, dict):
+            request_body = props
+        elif isinstance(props, (str, bytes)):
+            request_body = _json_loads(props)
+        else:
+            request_body = {}
         
         # Route to appropriate handler based on API path
-        if api_path == '/upload-video' and http_method == 'POST':
-            return handle_upload_video(request_body, api_path, http_method)
-        elif api_path == '/list-videos' and http_method == 'GET':
-            return handle_list_videos(parameters, api_path, http_method)
-        elif api_path == '/video-status' and http_method == 'GET':
-            return handle_video_status(parameters, api_path, http_method)
-        else:
+        handler = _ROUTES.get((api_path, http_method))
+        if handler is None:
             return create_error_response(f"Unknown API path: {api_path}", api_path, http_method)
+
+        payload = request_body if http_method == 'POST' else parameters
+        return handler(payload, api_path, http_method)
             
     except Exception as e:
-        logger.error(f"Error in lambda_handler: {str(e)}")
+        logger.error("Error in lambda_handler: %s", e)
         return create_error_response(str(e), api_path, http_method)
 
 
@@ -86,15 +152,16 @@ def handle_upload_video(request_body: Dict[str, Any], api_path: str = '', http_m
             return create_error_response("fileName is required", api_path, http_method)
         
         # Generate presigned URL
-        upload_info = generate_presigned_upload_url(file_name, content_type)
+        upload_info = _presign_upload(file_name, content_type)
         
-        # Create video record in DynamoDB
-        video_id = str(uuid.uuid4())
+        # 128 random bits straight from the OS; uuid4 builds the same
+        # entropy into a UUID object only to stringify it again
+        video_id = os.urandom(16).hex()
         video_record = {
             'videoId': video_id,
             'fileName': file_name,
             's3Uri': upload_info['s3_uri'],
-            'uploadTime': datetime.utcnow().isoformat(),
+            'uploadTime': datetime.now(timezone.utc).isoformat(),
             'status': 'uploaded',
             'contentType': content_type
         }
@@ -111,7 +178,56 @@ def handle_upload_video(request_body: Dict[str, Any], api_path: str = '', http_m
         return create_success_response(response_body, api_path, http_method)
         
     except Exception as e:
-        logger.error(f"Error in handle_upload_video: {str(e)}")
+        logger.error("Error in handle_upload_video: %s", e)
+        return create_error_response(str(e), api_path, http_method)
+
+
+def handle_upload_videos_batch(request_body: Dict[str, Any], api_path: str = '', http_method: str = '') -> Dict[str, Any]:
+    """
+    Generate presigned upload URLs for a batch of videos. Metadata records
+    are written concurrently and folded into the listing index with one
+    conditional update, instead of paying the per-request overhead of
+    /upload-video once per video.
+    """
+    try:
+        videos = request_body.get('videos')
+        if not isinstance(videos, list) or not videos:
+            return create_error_response("videos must be a non-empty list", api_path, http_method)
+
+        records = []
+        uploads = []
+        for item in videos:
+            file_name = item.get('fileName')
+            if not file_name:
+                return create_error_response("fileName is required for every video", api_path, http_method)
+
+            content_type = item.get('contentType', 'video/mp4')
+            upload_info = _presign_upload(file_name, content_type)
+            records.append({
+                'videoId': os.urandom(16).hex(),
+                'fileName': file_name,
+                's3Uri': upload_info['s3_uri'],
+                'uploadTime': datetime.now(timezone.utc).isoformat(),
+                'status': 'uploaded',
+                'contentType': content_type
+            })
+            uploads.append({
+                'uploadUrl': upload_info['upload_url'],
+                's3Uri': upload_info['s3_uri'],
+                'videoId': records[-1]['videoId']
+            })
+
+        # S3 has no multi-object put, so issue the record writes through
+        # the shared pool; the index is still updated exactly once
+        list(_FETCH_POOL.map(_put_video_record, records))
+        _update_video_index(records)
+
+        logger.info("Stored metadata for a batch of %d videos", len(records))
+
+        return create_success_response({'videos': uploads}, api_path, http_method)
+
+    except Exception as e:
+        logger.error("Error in handle_upload_videos_batch: %s", e)
         return create_error_response(str(e), api_path, http_method)
 
 
@@ -133,7 +249,7 @@ def handle_list_videos(parameters: Dict[str, Any], api_path: str = '', http_meth
         return create_success_response(response_body, api_path, http_method)
         
     except Exception as e:
-        logger.error(f"Error in handle_list_videos: {str(e)}")
+        logger.error("Error in handle_list_videos: %s", e)
         return create_error_response(str(e), api_path, http_method)
 
 
@@ -163,72 +279,218 @@ def handle_video_status(parameters: Dict[str, Any], api_path: str = '', http_met
         return create_success_response(response_body, api_path, http_method)
         
     except Exception as e:
-        logger.error(f"Error in handle_video_status: {str(e)}")
+        logger.error("Error in handle_video_status: %s", e)
         return create_error_response(str(e), api_path, http_method)
 
 
+# Route table for constant-time dispatch; POST handlers receive the
+# request body, GET handlers the query parameters
+_ROUTES: Dict[Tuple[str, str], Callable[..., Dict[str, Any]]] = {
+    ('/upload-video', 'POST'): handle_upload_video,
+    ('/upload-videos', 'POST'): handle_upload_videos_batch,
+    ('/list-videos', 'GET'): handle_list_videos,
+    ('/video-status', 'GET'): handle_video_status
+}
+
+
 def store_video_metadata(video_record: Dict[str, Any]) -> None:
     """
     Store video metadata in S3.
     """
     try:
-        s3_client = boto3.client('s3')
-        bucket_name = os.environ.get('AWS_BUCKET_NAME')
-        
-        metadata_key = f"metadata/videos/{video_record['videoId']}.json"
-        
-        s3_client.put_object(
-            Bucket=bucket_name,
-            Key=metadata_key,
-            Body=json.dumps(video_record, indent=2),
-            ContentType='application/json'
-        )
-        
-        logger.info(f"Stored video metadata for {video_record['videoId']} in S3")
-        
+        _put_video_record(video_record)
+        _update_video_index([video_record])
+
+        logger.info("Stored video metadata for %s in S3", video_record['videoId'])
+
     except Exception as e:
-        logger.error(f"Error storing video metadata: {str(e)}")
+        logger.error("Error storing video metadata: %s", e)
         raise
 
 
+def _put_video_record(video_record: Dict[str, Any]) -> None:
+    """
+    Write one video metadata object, mirroring the filterable fields into
+    S3 user metadata so list filtering can answer from head_object without
+    downloading bodies.
+    """
+    metadata_key = f"metadata/videos/{video_record['videoId']}.json"
+
+    s3_client.put_object(
+        Bucket=_BUCKET,
+        Key=metadata_key,
+        Body=gzip.compress(_json_dumps(video_record).encode('utf-8'), compresslevel=1),
+        ContentType='application/json',
+        ContentEncoding='gzip',
+        Metadata={
+            'status': video_record.get('status', ''),
+            'uploadtime': video_record.get('uploadTime', ''),
+            'filename': video_record.get('fileName', ''),
+            's3uri': video_record.get('s3Uri', '')
+        }
+    )
+
+
+def _update_video_index(video_records: List[Dict[str, Any]]) -> None:
+    """
+    Merge the listing fields of one or more videos into the aggregate
+    index with a compare-and-swap on the object's ETag. Best-effort: the
+    listing falls back to a prefix scan if the index is missing or
+    contended.
+    """
+    for _ in range(5):
+        etag = None
+        index = {}
+        try:
+            response = s3_client.get_object(Bucket=_BUCKET, Key=_INDEX_KEY)
+            etag = response['ETag']
+            index = _read_json_body(response)
+        except _NoSuchKey:
+            pass
+
+        for video_record in video_records:
+            entry = {
+                'videoId': video_record['videoId'],
+                'status': video_record.get('status', ''),
+                'uploadTime': video_record.get('uploadTime', ''),
+                'fileName': video_record.get('fileName', ''),
+                's3Uri': video_record.get('s3Uri', '')
+            }
+            index[entry['videoId']] = {**index.get(entry['videoId'], {}), **entry}
+
+        put_kwargs = {
+            'Bucket': _BUCKET,
+            'Key': _INDEX_KEY,
+            'Body': gzip.compress(_json_dumps(index).encode('utf-8'), compresslevel=1),
+            'ContentType': 'application/json',
+            'ContentEncoding': 'gzip'
+        }
+        # Conditional write: retry from a fresh read if another writer
+        # touched the index between our GET and PUT
+        if etag is not None:
+            put_kwargs['IfMatch'] = etag
+        else:
+            put_kwargs['IfNoneMatch'] = '*'
+
+        try:
+            s3_client.put_object(**put_kwargs)
+            return
+        except ClientError as e:
+            if e.response['Error']['Code'] not in ('PreconditionFailed', '412'):
+                raise
+
+    logger.warning("Video index update lost the CAS race for %d record(s); listing will fall back to a scan for them", len(video_records))
+
+
+# Shared pool for the metadata fan-out; boto3 clients are thread-safe and
+# the listing is dominated by per-object round-trip latency, not CPU
+_FETCH_POOL = ThreadPoolExecutor(max_workers=16)
+
+
+def _read_json_body(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse a get_object response body, decompressing gzip-encoded objects."""
+    body = response['Body']
+    try:
+        raw = body.read()
+    finally:
+        # Release the urllib3 connection back to the pool immediately
+        # instead of waiting for garbage collection
+        body.close()
+    if response.get('ContentEncoding') == 'gzip':
+        raw = gzip.decompress(raw)
+    return _json_loads(raw)
+
+
+def _fetch_video_record(key: str) -> Dict[str, Any]:
+    """Fetch and parse one video metadata object; None on failure."""
+    try:
+        response = s3_client.get_object(Bucket=_BUCKET, Key=key)
+        return _read_json_body(response)
+    except Exception as e:
+        logger.warning("Error reading video metadata %s: %s", key, e)
+        return None
+
+
+def _head_video_record(key: str) -> Dict[str, Any]:
+    """
+    Build a slim video record from mirrored S3 user metadata without
+    downloading the body; falls back to a full fetch for objects written
+    before the status mirror existed.
+    """
+    try:
+        meta = s3_client.head_object(Bucket=_BUCKET, Key=key).get('Metadata', {})
+    except Exception as e:
+        logger.warning("Error probing video metadata %s: %s", key, e)
+        return None
+
+    if 'status' not in meta or 'filename' not in meta:
+        return _fetch_video_record(key)
+
+    return {
+        'videoId': key.rsplit('/', 1)[-1][:-5],
+        'status': meta['status'],
+        'uploadTime': meta.get('uploadtime', ''),
+        'fileName': meta['filename'],
+        's3Uri': meta.get('s3uri', '')
+    }
+
+
 def get_videos_from_db(limit: int, status_filter: str = None) -> List[Dict[str, Any]]:
     """
     Retrieve videos from S3 metadata with optional filtering.
     """
     try:
-        s3_client = boto3.client('s3')
-        bucket_name = os.environ.get('AWS_BUCKET_NAME')
-        
-        # List all video metadata files
-        response = s3_client.list_objects_v2(
-            Bucket=bucket_name,
+        # One GET of the aggregate index answers the listing outright
+        try:
+            index = _read_json_body(s3_client.get_object(Bucket=_BUCKET, Key=_INDEX_KEY))
+        except _NoSuchKey:
+            index = None
+
+        if index is not None:
+            videos = []
+            for entry in index.values():
+                if status_filter is None or entry.get('status') == status_filter:
+                    videos.append(entry)
+                    if len(videos) >= limit:
+                        break
+            return videos
+
+        # No index yet: page through the metadata prefix; a single
+        # list_objects_v2 call silently caps at 1000 keys and would miss
+        # videos beyond that
+        paginator = s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(
+            Bucket=_BUCKET,
             Prefix='metadata/videos/',
-            MaxKeys=limit
+            PaginationConfig={'PageSize': min(limit, 1000)}
         )
-        
+
+        # Status filtering only needs the fields mirrored into user
+        # metadata, so probe with head_object instead of fetching bodies
+        fetcher = _head_video_record if status_filter else _fetch_video_record
+
         videos = []
-        if 'Contents' in response:
-            for obj in response['Contents']:
-                try:
-                    # Get each metadata file
-                    metadata_response = s3_client.get_object(
-                        Bucket=bucket_name,
-                        Key=obj['Key']
-                    )
-                    video_data = json.loads(metadata_response['Body'].read().decode('utf-8'))
-                    
-                    # Apply status filter if provided
-                    if status_filter is None or video_data.get('status') == status_filter:
-                        videos.append(video_data)
-                        
-                except Exception as e:
-                    logger.warning(f"Error reading video metadata {obj['Key']}: {str(e)}")
+        for page in pages:
+            keys = [obj['Key'] for obj in page.get('Contents', []) if obj['Key'] != _INDEX_KEY]
+            if not keys:
+                continue
+
+            # Fetch the page's objects concurrently; results come back in
+            # key order so the listing stays deterministic
+            for video_data in _FETCH_POOL.map(fetcher, keys):
+                if video_data is None:
                     continue
-        
-        return videos[:limit]
+
+                # Apply status filter if provided
+                if status_filter is None or video_data.get('status') == status_filter:
+                    videos.append(video_data)
+                    if len(videos) >= limit:
+                        return videos
+
+        return videos
         
     except Exception as e:
-        logger.error(f"Error retrieving videos from S3: {str(e)}")
+        logger.error("Error retrieving videos from S3: %s", e)
         return []
 
 
@@ -237,27 +499,25 @@ def get_video_from_db(video_id: str) -> Dict[str, Any]:
     Retrieve a specific video metadata from S3.
     """
     try:
-        s3_client = boto3.client('s3')
-        bucket_name = os.environ.get('AWS_BUCKET_NAME')
-        
         metadata_key = f"metadata/videos/{video_id}.json"
         
-        response = s3_client.get_object(Bucket=bucket_name, Key=metadata_key)
-        video_data = json.loads(response['Body'].read().decode('utf-8'))
+        response = s3_client.get_object(Bucket=_BUCKET, Key=metadata_key)
+        video_data = _read_json_body(response)
         
         return video_data
         
-    except s3_client.exceptions.NoSuchKey:
-        logger.warning(f"Video metadata not found for {video_id}")
+    except _NoSuchKey:
+        logger.warning("Video metadata not found for %s", video_id)
         return {}
     except Exception as e:
-        logger.error(f"Error retrieving video from S3: {str(e)}")
+        logger.error("Error retrieving video from S3: %s", e)
         return {}
 
 
-def create_success_response(body: Dict[str, Any], api_path: str = '', http_method: str = '') -> Dict[str, Any]:
+def _agent_response(api_path: str, http_method: str, status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Create a successful response for Bedrock Agent.
+    Build the Bedrock Agent response envelope; only the per-request fields
+    vary, so success and error paths share one constructor.
     """
     return {
         'messageVersion': '1.0',
@@ -265,33 +525,25 @@ def create_success_response(body: Dict[str, Any], api_path: str = '', http_metho
             'actionGroup': 'VideoManagement',
             'apiPath': api_path,
             'httpMethod': http_method,
-            'httpStatusCode': 200,
+            'httpStatusCode': status_code,
             'responseBody': {
                 'application/json': {
-                    'body': json.dumps(body)
+                    'body': _json_dumps(body)
                 }
             }
         }
     }
 
 
+def create_success_response(body: Dict[str, Any], api_path: str = '', http_method: str = '') -> Dict[str, Any]:
+    """
+    Create a successful response for Bedrock Agent.
+    """
+    return _agent_response(api_path, http_method, 200, body)
+
+
 def create_error_response(error_message: str, api_path: str = '', http_method: str = '') -> Dict[str, Any]:
     """
     Create an error response for Bedrock Agent.
     """
-    return {
-        'messageVersion': '1.0',
-        'response': {
-            'actionGroup': 'VideoManagement',
-            'apiPath': api_path,
-            'httpMethod': http_method,
-            'httpStatusCode': 400,
-            'responseBody': {
-                'application/json': {
-                    'body': json.dumps({
-                        'error': error_message
-                    })
-                }
-            }
-        }
-    }
+    return _agent_response(api_path, http_method, 400, {'error': error_message})
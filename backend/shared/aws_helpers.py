@@ -5,28 +5,76 @@ Migrated and adapted from the original MCP server helpers.
 
 import asyncio
 import boto3
+import copy
+from botocore.config import Config
+from botocore.exceptions import ClientError
 import json
 import os
-import uuid
-from datetime import datetime
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache, partial
 import logging
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple, List
+from urllib.parse import urlsplit
+
+try:
+    import orjson  # bundled in the Lambda layer / API server env; 2-5x faster
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON from bytes or str, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode('utf-8')
+    return json.loads(data)
 
 
 # Set up logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Shared executor for blocking SDK calls made from async helpers; boto3 has
+# no native asyncio support, so without this every call stalls the event
+# loop and serializes concurrent gather() callsites
+_EXECUTOR = ThreadPoolExecutor(max_workers=16)
+
+
+async def _run_blocking(func, *args, **kwargs):
+    """Run a blocking SDK call on the shared executor, keeping the event loop free."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, partial(func, *args, **kwargs))
+
+def _random_hex() -> str:
+    """128 random bits as hex; skips uuid.UUID object construction."""
+    return os.urandom(16).hex()
+
+
+@lru_cache(maxsize=1)
 def get_region() -> str:
     """Get the AWS region from environment variables."""
     return os.environ.get('AWS_REGION', 'us-east-1')
 
 
+@lru_cache(maxsize=1)
 def get_account_id() -> str:
-    """Get the AWS account ID using STS get_caller_identity."""
-    session = get_aws_session()
-    sts_client = session.client('sts', region_name=get_region())
+    """Get the AWS account ID, memoized for the life of the process.
+
+    The account never changes inside a container, so the STS round-trip
+    only happens once; AWS_ACCOUNT_ID short-circuits it entirely when set.
+    Failures are not cached, so a transient STS error retries next call.
+    """
+    account_id = os.environ.get('AWS_ACCOUNT_ID')
+    if account_id:
+        return account_id
+
+    sts_client = _get_client('sts', get_region())
     try:
         response = sts_client.get_caller_identity()
         return response['Account']
@@ -35,6 +83,7 @@ def get_account_id() -> str:
         raise ValueError(f'Failed to get AWS account ID: {str(e)}')
 
 
+@lru_cache(maxsize=1)
 def get_bucket_name() -> Optional[str]:
     """Get the S3 bucket name from environment variables."""
     bucket_name = os.environ.get('AWS_BUCKET_NAME')
@@ -43,49 +92,81 @@ def get_bucket_name() -> Optional[str]:
     return bucket_name
 
 
-def get_aws_session(region_name=None):
-    """Create an AWS session using default AWS credential chain.
-    
-    This matches the MCP server behavior which uses the default credential chain
-    (shared credentials file) instead of named profiles.
-    """
-    region = region_name or get_region()
-    
+@lru_cache(maxsize=None)
+def _create_session(region: str):
+    """Build one session per region; creating a boto3 Session re-resolves
+    credentials and loads endpoint data, so it must not happen per call."""
     # Always use default credential chain (like MCP server does)
     # This will use credentials from ~/.aws/credentials (shared-credentials-file)
     logger.debug('Using default AWS credential chain from ~/.aws/credentials')
-    return boto3.Session(region_name=region)
+    session = boto3.Session(region_name=region)
+    # Resolve credentials eagerly: botocore hands back refreshable
+    # credentials that cache until expiry, so clients sharing this session
+    # never re-query IMDS/STS on the hot path
+    session.get_credentials()
+    return session
+
+
+def get_aws_session(region_name=None):
+    """Get the cached AWS session using default AWS credential chain.
+
+    This matches the MCP server behavior which uses the default credential chain
+    (shared credentials file) instead of named profiles. The session is created
+    once per region and reused across calls.
+    """
+    return _create_session(region_name or get_region())
+
+
+# Shared transport settings: the pool must cover the blocking-call
+# executor so parallel S3 fetches do not re-handshake TLS, the read
+# timeout leaves room for Bedrock agent streaming, and adaptive retries
+# back off cleanly under throttling
+_CLIENT_CONFIG = Config(
+    connect_timeout=3,
+    read_timeout=60,
+    max_pool_connections=25,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 5}
+)
+
+
+@lru_cache(maxsize=None)
+def _get_client(service_name: str, region: str):
+    """Create and cache one low-level client per (service, region).
+
+    Client construction parses the service model JSON and resolves
+    credentials, which costs tens of milliseconds; botocore clients are
+    thread-safe, so every caller can share the same instance.
+    """
+    return get_aws_session(region).client(service_name, region_name=region, config=_CLIENT_CONFIG)
 
 
+@lru_cache(maxsize=1)
 def get_profile_arn() -> Optional[str]:
-    """Get the Bedrock Data Automation profile ARN."""
+    """Get the Bedrock Data Automation profile ARN, memoized per process."""
     region = get_region()
     account_id = get_account_id()
     return f'arn:aws:bedrock:{region}:{account_id}:data-automation-profile/us.data-automation-v1'
 
 
 def get_bedrock_data_automation_client():
-    """Get a Bedrock Data Automation client for Data Automation APIs."""
-    session = get_aws_session()
-    return session.client('bedrock-data-automation', region_name=get_region())
+    """Get the shared Bedrock Data Automation client for Data Automation APIs."""
+    return _get_client('bedrock-data-automation', get_region())
 
 
 def get_bedrock_data_automation_runtime_client():
-    """Get a Bedrock Data Automation Runtime client."""
-    session = get_aws_session()
-    return session.client('bedrock-data-automation-runtime', region_name=get_region())
+    """Get the shared Bedrock Data Automation Runtime client."""
+    return _get_client('bedrock-data-automation-runtime', get_region())
 
 
 def get_bedrock_agent_runtime_client():
-    """Get a Bedrock Agent Runtime client."""
-    session = get_aws_session()
-    return session.client('bedrock-agent-runtime', region_name=get_region())
+    """Get the shared Bedrock Agent Runtime client."""
+    return _get_client('bedrock-agent-runtime', get_region())
 
 
 def get_s3_client():
-    """Get an S3 client."""
-    session = get_aws_session()
-    return session.client('s3', region_name=get_region())
+    """Get the shared S3 client."""
+    return _get_client('s3', get_region())
 
 
 def sanitize_path(file_path: str, base_dir: Optional[str] = None) -> Path:
@@ -108,10 +189,40 @@ def sanitize_path(file_path: str, base_dir: Optional[str] = None) -> Path:
 
 def get_bucket_and_key_from_s3_uri(s3_uri: str) -> Tuple[str, str]:
     """Parse an S3 URI into bucket and key."""
-    parts = s3_uri.split('/')
-    bucket = parts[2]
-    key = '/'.join(parts[3:])
-    return bucket, key
+    parts = urlsplit(s3_uri)
+    if parts.scheme != 's3' or not parts.netloc:
+        raise ValueError(f'Invalid S3 URI: {s3_uri}')
+    return parts.netloc, parts.path.lstrip('/')
+
+
+# A single S3 GET tops out at roughly 50 MB/s per stream; objects above
+# this size are fetched as parallel byte-range GETs instead.
+_S3_PARALLEL_GET_THRESHOLD = int(os.environ.get('S3_PARALLEL_GET_THRESHOLD_BYTES', 8 * 1024 * 1024))
+_S3_PARALLEL_GET_STREAMS = 8
+
+
+async def _get_object_bytes(s3_client, bucket: str, key: str) -> bytes:
+    """Fetch an object's bytes, splitting large objects across range GETs."""
+    head = await _run_blocking(s3_client.head_object, Bucket=bucket, Key=key)
+    size = head['ContentLength']
+
+    if size <= _S3_PARALLEL_GET_THRESHOLD:
+        response = await _run_blocking(s3_client.get_object, Bucket=bucket, Key=key)
+        return await _run_blocking(response['Body'].read)
+
+    chunk_size = -(-size // _S3_PARALLEL_GET_STREAMS)
+    buffer = bytearray(size)
+
+    async def _fetch_range(offset: int) -> None:
+        end = min(offset + chunk_size, size) - 1
+        response = await _run_blocking(
+            s3_client.get_object, Bucket=bucket, Key=key, Range=f'bytes={offset}-{end}'
+        )
+        data = await _run_blocking(response['Body'].read)
+        buffer[offset:offset + len(data)] = data
+
+    await asyncio.gather(*(_fetch_range(offset) for offset in range(0, size, chunk_size)))
+    return bytes(buffer)
 
 
 async def download_from_s3(s3_uri: str) -> Optional[Dict[str, Any]]:
@@ -120,9 +231,8 @@ async def download_from_s3(s3_uri: str) -> Optional[Dict[str, Any]]:
 
     s3_client = get_s3_client()
     try:
-        response = s3_client.get_object(Bucket=bucket, Key=key)
-        content = response['Body'].read().decode('utf-8')
-        return json.loads(content)
+        content = await _get_object_bytes(s3_client, bucket, key)
+        return _json_loads(content)
     except Exception as e:
         raise ValueError(f'Error downloading from S3: {e}')
 
@@ -130,12 +240,13 @@ async def download_from_s3(s3_uri: str) -> Optional[Dict[str, Any]]:
 async def generate_presigned_upload_url(file_name: str, content_type: str = 'video/mp4') -> Dict[str, str]:
     """Generate a presigned URL for direct S3 upload from frontend."""
     bucket_name = get_bucket_name()
-    key = f'videos/{uuid.uuid4()}/{file_name}'
+    key = f'videos/{_random_hex()}/{file_name}'
     
     s3_client = get_s3_client()
     
     try:
-        presigned_url = s3_client.generate_presigned_url(
+        presigned_url = await _run_blocking(
+            s3_client.generate_presigned_url,
             'put_object',
             Params={
                 'Bucket': bucket_name,
@@ -183,7 +294,7 @@ async def invoke_bedrock_data_automation(
     logger.info(f'Project ARN 2: {project_arn}')
 
     # Generate unique job name
-    job_name = f"game-analysis-{uuid.uuid4()}"
+    job_name = f"game-analysis-{_random_hex()}"
     bucket_name = get_bucket_name()
     output_prefix = output_s3_prefix or f"data-automation-results/{job_name}/"
     
@@ -201,7 +312,8 @@ async def invoke_bedrock_data_automation(
 
         # Start Data Automation job using correct API parameters
         # IMPORTANT: Parameter order matters! Must match MCP server working implementation
-        response = da_runtime_client.invoke_data_automation_async(
+        response = await _run_blocking(
+            da_runtime_client.invoke_data_automation_async,
             inputConfiguration={
                 's3Uri': s3_uri
             },
@@ -213,7 +325,7 @@ async def invoke_bedrock_data_automation(
             },
             dataAutomationProfileArn=profile_arn
         )
-        
+
         # Extract job information from response
         invocation_arn = response.get('invocationArn')
         logger.info(f'Data Automation invoked: {invocation_arn}')
@@ -235,9 +347,9 @@ async def get_data_automation_job_status(job_arn: str) -> Dict[str, Any]:
     try:
         da_client = get_bedrock_data_automation_client()
         
-        response = da_client.get_data_automation_job(jobArn=job_arn)
+        response = await _run_blocking(da_client.get_data_automation_job, jobArn=job_arn)
         
-        job_id = job_arn.split('/')[-1] if '/' in job_arn else job_arn
+        job_id = job_arn.rpartition('/')[2] or job_arn
         
         return {
             'jobId': job_id,
@@ -250,7 +362,7 @@ async def get_data_automation_job_status(job_arn: str) -> Dict[str, Any]:
         
     except Exception as e:
         logger.error(f'Failed to get job status: {e}')
-        job_id = job_arn.split('/')[-1] if '/' in job_arn else job_arn
+        job_id = job_arn.rpartition('/')[2] or job_arn
         return {
             'jobId': job_id,
             'jobArn': job_arn,
@@ -270,11 +382,11 @@ async def get_data_automation_results(job_id: str, output_s3_prefix: str) -> Opt
         results_key = f"{output_s3_prefix}results.json"
         
         try:
-            response = s3_client.get_object(Bucket=bucket_name, Key=results_key)
-            content = response['Body'].read().decode('utf-8')
-            da_results = json.loads(content)
-            
-            logger.info(f'Retrieved Data Automation results: {len(content)} characters')
+            response = await _run_blocking(s3_client.get_object, Bucket=bucket_name, Key=results_key)
+            content = await _run_blocking(response['Body'].read)
+            da_results = _json_loads(content)
+
+            logger.info(f'Retrieved Data Automation results: {response.get("ContentLength", len(content))} bytes')
             
             # Process and structure the game-specific data
             structured_results = process_game_data_automation_results(da_results)
@@ -290,6 +402,22 @@ async def get_data_automation_results(job_id: str, output_s3_prefix: str) -> Opt
         return None
 
 
+# Per-chapter inference categories, processed by one data-driven loop in
+# process_game_data_automation_results. Specs are flat tuples so the loop
+# pays one unpack per category instead of half a dozen dict probes:
+# (field, type_key, player_key, highlight_prefix, confidence, scene_prefix,
+#  is_crowd, counts_goals, counts_penalties)
+_CHAPTER_CATEGORIES: Tuple[Tuple, ...] = (
+    ('player_actions', 'action_type', 'player_name', 'player_', 0.9, None, False, True, False),
+    ('game_events', 'event_type', None, 'game_', 0.9, None, False, True, False),
+    ('violations', 'violation_type', 'player_involved', 'violation_', 0.85, None, False, False, True),
+    ('spectator_reactions', 'reaction_type', None, 'crowd_', 0.8, None, True, False, False),
+    ('locker_room_scenes', 'scene_type', None, 'scene_locker_', 0.85, 'locker_', False, False, False),
+    ('team_bus_scenes', 'scene_type', None, 'scene_bus_', 0.85, 'bus_', False, False, False),
+    ('off_field_scenes', 'scene_type', None, None, 0.0, '', False, False, False),
+)
+
+
 def process_game_data_automation_results(da_results: Dict[str, Any]) -> Dict[str, Any]:
     """
     Process Data Automation results into frontend-compatible format.
@@ -312,7 +440,9 @@ def process_game_data_automation_results(da_results: Dict[str, Any]) -> Dict[str
         scenes = []
         crowd_reactions = []
         chapter_summaries = []
-        key_players = set()
+        # dict keys double as an ordered set: dedupes while keeping players
+        # in order of first appearance for the frontend
+        key_players: Dict[str, None] = {}
         total_goals = 0
         total_penalties = 0
         total_duration = 0
@@ -343,15 +473,30 @@ def process_game_data_automation_results(da_results: Dict[str, Any]) -> Dict[str
         chapters = custom_output.get('chapters', [])
         
         for chapter in chapters:
-            chapter_inference = chapter.get('inference_result', {})
-            
+            chapter_inference = chapter.get('inference_result') or {}
+
             # Convert timestamps from milliseconds to seconds
             start_time = chapter.get('start_timestamp_millis', 0) / 1000
             end_time = chapter.get('end_timestamp_millis', 0) / 1000
             duration = chapter.get('duration_millis', 0) / 1000
             timecode = chapter.get('start_timecode_smpte', '00:00:00;00')
             chapter_index = chapter.get('chapter_index', 0)
-            
+
+            def add_highlight(type_: str, description: str, player_name: Optional[str] = None,
+                              confidence: float = 0.9) -> None:
+                """Append a timeline highlight for the current chapter."""
+                entry = {
+                    'type': type_,
+                    'timestamp': start_time,
+                    'endTimestamp': end_time,
+                    'description': description,
+                    'timecode': timecode,
+                    'confidence': confidence
+                }
+                if player_name is not None:
+                    entry['playerName'] = player_name
+                highlights.append(entry)
+
             # Add chapter summary (NEW)
             chapter_summaries.append({
                 'index': chapter_index,
@@ -361,171 +506,56 @@ def process_game_data_automation_results(da_results: Dict[str, Any]) -> Dict[str
                 'timecode': timecode,
                 'summary': f"Chapter {chapter_index + 1}"
             })
-            
-            # Extract player actions (goals, saves, hits, etc.)
-            player_actions = chapter_inference.get('player_actions', {})
-            if player_actions and player_actions.get('action_type'):
-                action_type = player_actions.get('action_type', '')
-                player_name = player_actions.get('player_name', '')
-                description = player_actions.get('description', '')
-                
+
+            for (field, type_key, player_key, highlight_prefix, confidence,
+                 scene_prefix, is_crowd, counts_goals, counts_penalties) in _CHAPTER_CATEGORIES:
+                data = chapter_inference.get(field)
+                if not data:
+                    continue
+
+                type_value = data.get(type_key)
+                description = data.get('description', '')
+
                 # Skip empty or "Not applicable" entries
-                if action_type and description and description != 'Not applicable':
-                    highlights.append({
-                        'type': f"player_{action_type}",
-                        'timestamp': start_time,
-                        'endTimestamp': end_time,
-                        'description': description,
-                        'timecode': timecode,
-                        'playerName': player_name,
-                        'confidence': 0.9
-                    })
-                    
-                    # Track goals
-                    if action_type.lower() == 'goal':
-                        total_goals += 1
-                    
-                    # Track players
-                    if player_name:
-                        key_players.add(player_name)
-            
-            # Extract game events (celebrations, penalties, fights, etc.)
-            game_events = chapter_inference.get('game_events', {})
-            if game_events and game_events.get('event_type'):
-                event_type = game_events.get('event_type', '')
-                description = game_events.get('description', '')
-                
-                if event_type and description and description != 'Not applicable':
-                    highlights.append({
-                        'type': f"game_{event_type}",
-                        'timestamp': start_time,
-                        'endTimestamp': end_time,
-                        'description': description,
-                        'timecode': timecode,
-                        'confidence': 0.9
-                    })
-                    
-                    # Track goals from game events too
-                    if event_type.lower() == 'goal':
-                        total_goals += 1
-            
-            # Extract violations (penalties, fouls, etc.)
-            violations = chapter_inference.get('violations', {})
-            if violations and violations.get('violation_type'):
-                violation_type = violations.get('violation_type', '')
-                player_involved = violations.get('player_involved', '')
-                description = violations.get('description', '')
-                
-                if violation_type and description and description != 'Not applicable':
-                    highlights.append({
-                        'type': f"violation_{violation_type}",
-                        'timestamp': start_time,
-                        'endTimestamp': end_time,
-                        'description': description,
-                        'timecode': timecode,
-                        'playerName': player_involved,
-                        'confidence': 0.85
-                    })
-                    total_penalties += 1
-                    
-                    if player_involved:
-                        key_players.add(player_involved)
-            
-            # Extract crowd reactions (ENHANCED)
-            spectator_reactions = chapter_inference.get('spectator_reactions', {})
-            if spectator_reactions and spectator_reactions.get('reaction_type'):
-                reaction_type = spectator_reactions.get('reaction_type', '')
-                description = spectator_reactions.get('description', '')
-                
-                if reaction_type and description and description != 'Not applicable' and description:
-                    # Add to crowd reactions array (NEW)
-                    crowd_reactions.append({
-                        'type': reaction_type,
-                        'timestamp': start_time,
-                        'endTimestamp': end_time,
-                        'description': description,
-                        'timecode': timecode
-                    })
-                    
-                    # Also add to highlights for timeline
-                    highlights.append({
-                        'type': f"crowd_{reaction_type}",
-                        'timestamp': start_time,
-                        'endTimestamp': end_time,
-                        'description': description,
-                        'timecode': timecode,
-                        'confidence': 0.8
-                    })
-            
-            # Extract locker room scenes
-            locker_scenes = chapter_inference.get('locker_room_scenes', {})
-            if locker_scenes and locker_scenes.get('scene_type'):
-                scene_type = locker_scenes.get('scene_type', '')
-                description = locker_scenes.get('description', '')
-                
-                if scene_type and description and description != 'Not applicable':
-                    scenes.append({
-                        'type': f"locker_{scene_type}",
-                        'startTime': start_time,
-                        'endTime': end_time,
-                        'description': description
-                    })
-                    
-                    # Also add to highlights for timeline
-                    highlights.append({
-                        'type': f"scene_locker_{scene_type}",
-                        'timestamp': start_time,
-                        'endTimestamp': end_time,
-                        'description': description,
-                        'timecode': timecode,
-                        'confidence': 0.85
-                    })
-            
-            # Extract team bus scenes
-            bus_scenes = chapter_inference.get('team_bus_scenes', {})
-            if bus_scenes and bus_scenes.get('scene_type'):
-                scene_type = bus_scenes.get('scene_type', '')
-                description = bus_scenes.get('description', '')
-                
-                if scene_type and description and description != 'Not applicable':
+                if not type_value or not description or description == 'Not applicable':
+                    continue
+
+                player_name = data.get(player_key, '') if player_key else None
+
+                if scene_prefix is not None:
                     scenes.append({
-                        'type': f"bus_{scene_type}",
+                        'type': f"{scene_prefix}{type_value}" if scene_prefix else type_value,
                         'startTime': start_time,
                         'endTime': end_time,
                         'description': description
                     })
-                    
-                    highlights.append({
-                        'type': f"scene_bus_{scene_type}",
+
+                if is_crowd:
+                    crowd_reactions.append({
+                        'type': type_value,
                         'timestamp': start_time,
                         'endTimestamp': end_time,
                         'description': description,
-                        'timecode': timecode,
-                        'confidence': 0.85
-                    })
-            
-            # Extract off-field scenes
-            off_field_scenes = chapter_inference.get('off_field_scenes', {})
-            if off_field_scenes and off_field_scenes.get('scene_type'):
-                scene_type = off_field_scenes.get('scene_type', '')
-                description = off_field_scenes.get('description', '')
-                
-                if scene_type and description and description != 'Not applicable':
-                    scenes.append({
-                        'type': scene_type,
-                        'startTime': start_time,
-                        'endTime': end_time,
-                        'description': description
+                        'timecode': timecode
                     })
-        
-        # Sort highlights by timestamp
-        highlights.sort(key=lambda x: x.get('timestamp', 0))
-        
-        # Sort crowd reactions by timestamp
-        crowd_reactions.sort(key=lambda x: x.get('timestamp', 0))
-        
-        # Sort chapters by index
-        chapter_summaries.sort(key=lambda x: x.get('index', 0))
+
+                if highlight_prefix is not None:
+                    add_highlight(f"{highlight_prefix}{type_value}", description,
+                                  player_name=player_name,
+                                  confidence=confidence)
+
+                if counts_goals and type_value.lower() == 'goal':
+                    total_goals += 1
+                if counts_penalties:
+                    total_penalties += 1
+                if player_name:
+                    key_players[player_name] = None
+
+        # Sort by timestamp/index; every entry is built with these keys, so
+        # the C-level itemgetter beats a Python lambda per comparison
+        highlights.sort(key=itemgetter('timestamp'))
+        crowd_reactions.sort(key=itemgetter('timestamp'))
+        chapter_summaries.sort(key=itemgetter('index'))
         
         # Build enhanced result matching frontend interface
         result = {
@@ -546,7 +576,7 @@ def process_game_data_automation_results(da_results: Dict[str, Any]) -> Dict[str
             'crowdReactions': crowd_reactions,
             'chapters': chapter_summaries,
             'analysisConfidence': analysis_confidence,
-            'analysisTimestamp': datetime.utcnow().isoformat()
+            'analysisTimestamp': datetime.now(timezone.utc).isoformat()
         }
         
         logger.info(f'Processed game analysis: {len(highlights)} highlights, '
@@ -558,19 +588,24 @@ def process_game_data_automation_results(da_results: Dict[str, Any]) -> Dict[str
         
     except Exception as e:
         logger.error(f'Failed to process game Data Automation results: {e}')
-        return {
-            'highlights': [],
-            'gameStats': {
-                'totalGoals': 0,
-                'totalPenalties': 0,
-                'keyPlayers': [],
-                'totalDuration': 0,
-                'highlightsCount': 0
-            },
-            'scenes': [],
-            'analysisTimestamp': datetime.utcnow().isoformat(),
-            'error': str(e)
-        }
+        return _empty_analysis_result(str(e))
+
+
+def _empty_analysis_result(error: str) -> Dict[str, Any]:
+    """Fallback analysis payload returned when result processing fails."""
+    return {
+        'highlights': [],
+        'gameStats': {
+            'totalGoals': 0,
+            'totalPenalties': 0,
+            'keyPlayers': [],
+            'totalDuration': 0,
+            'highlightsCount': 0
+        },
+        'scenes': [],
+        'analysisTimestamp': datetime.now(timezone.utc).isoformat(),
+        'error': error
+    }
 
 
 async def invoke_agent_with_structured_context(
@@ -593,36 +628,35 @@ async def invoke_agent_with_structured_context(
     
     # Build structured context from Data Automation results
     context = build_hockey_context_for_agent(structured_data, question)
-    
-    # Create enhanced prompt with structured context
-    enhanced_prompt = f"""
-Hockey Game Analysis Context:
-{context}
 
-User Question: {question}
-
-Please answer the question based on the structured game analysis data provided above. 
-Include specific timestamps, player names, and confidence scores when available.
-If the data doesn't contain relevant information for the question, please indicate that clearly.
-"""
+    # Create enhanced prompt with structured context
+    enhanced_prompt = _AGENT_PROMPT_TEMPLATE.format(context=context, question=question)
     
     try:
         runtime_client = get_bedrock_agent_runtime_client()
-        
-        response = runtime_client.invoke_agent(
-            agentId=agent_id,
-            agentAliasId=agent_alias_id,
-            sessionId=session_id or str(uuid.uuid4()),
-            inputText=enhanced_prompt
-        )
-        
-        # Process the streaming response
-        answer_text = ""
-        for event in response.get('completion', []):
-            if 'chunk' in event:
-                chunk = event['chunk']
-                if 'bytes' in chunk:
-                    answer_text += chunk['bytes'].decode('utf-8')
+
+        def _invoke_and_collect() -> str:
+            # Both the invocation and the streaming completion read block on
+            # the network, so the whole exchange runs on the executor
+            response = runtime_client.invoke_agent(
+                agentId=agent_id,
+                agentAliasId=agent_alias_id,
+                sessionId=session_id or _random_hex(),
+                inputText=enhanced_prompt
+            )
+
+            chunks = []
+            for event in response.get('completion', []):
+                if 'chunk' in event:
+                    chunk = event['chunk']
+                    if 'bytes' in chunk:
+                        chunks.append(chunk['bytes'])
+            # Join raw bytes first: one decode over the whole answer is
+            # cheaper and safe even if a multi-byte character straddles
+            # a chunk boundary
+            return b''.join(chunks).decode('utf-8')
+
+        answer_text = await _run_blocking(_invoke_and_collect)
         
         # Extract relevant information from structured data
         relevant_timestamps = extract_relevant_timestamps(structured_data, question)
@@ -642,23 +676,39 @@ If the data doesn't contain relevant information for the question, please indica
         raise ValueError(f'Agent Q&A failed: {str(e)}')
 
 
+# Constant prompt scaffolding rendered once per invocation; only the
+# context and question vary per call
+_AGENT_PROMPT_TEMPLATE = """
+Hockey Game Analysis Context:
+{context}
+
+User Question: {question}
+
+Please answer the question based on the structured game analysis data provided above.
+Include specific timestamps, player names, and confidence scores when available.
+If the data doesn't contain relevant information for the question, please indicate that clearly.
+"""
+
+
 def build_hockey_context_for_agent(structured_data: Dict[str, Any], question: str) -> str:
     """Build contextual information for the Agent based on structured hockey data."""
     context_parts = []
-    
+
     # Add game events context
     game_events = structured_data.get('game_events', [])
     if game_events:
         context_parts.append(f"Game Events ({len(game_events)} total):")
         for event in game_events[:5]:  # Top 5 events
-            context_parts.append(f"- {event.get('event')} at {event.get('timestamp')}: {event.get('description')}")
-    
+            name, timestamp, description = event.get('event'), event.get('timestamp'), event.get('description')
+            context_parts.append(f"- {name} at {timestamp}: {description}")
+
     # Add player actions context
     player_actions = structured_data.get('player_actions', [])
     if player_actions:
         context_parts.append(f"\nPlayer Actions ({len(player_actions)} total):")
         for action in player_actions[:5]:  # Top 5 actions
-            context_parts.append(f"- {action.get('player')} {action.get('action')} at {action.get('timestamp')}")
+            player, act, timestamp = action.get('player'), action.get('action'), action.get('timestamp')
+            context_parts.append(f"- {player} {act} at {timestamp}")
     
     # Add game context
     game_context = structured_data.get('game_context', {})
@@ -679,51 +729,76 @@ def build_hockey_context_for_agent(structured_data: Dict[str, Any], question: st
     return '\n'.join(context_parts)
 
 
+# Question words too common to signal relevance; subtracting them stops
+# every event from matching on "the" or "what"
+_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'is', 'are', 'was', 'were', 'at', 'in',
+    'on', 'of', 'to', 'did', 'do', 'does', 'what', 'when', 'who', 'how',
+    'any', 'there', 'it', 'that', 'this'
+})
+
+
+def _question_words(question: str) -> frozenset:
+    """Tokenize a question once, dropping words that would match anything."""
+    return frozenset(question.lower().split()) - _STOPWORDS
+
+
 def extract_relevant_timestamps(structured_data: Dict[str, Any], question: str) -> List[Dict[str, Any]]:
     """Extract timestamps relevant to the user's question."""
     relevant_timestamps = []
-    question_lower = question.lower()
-    
+    q_words = _question_words(question)
+    if not q_words:
+        return relevant_timestamps
+
     # Check game events for relevance
     for event in structured_data.get('game_events', []):
         event_text = f"{event.get('event', '')} {event.get('description', '')}".lower()
-        if any(word in event_text for word in question_lower.split()):
+        if q_words.intersection(event_text.split()):
             relevant_timestamps.append({
                 'timestamp': event.get('timestamp'),
                 'description': f"{event.get('event')}: {event.get('description')}",
                 'relevance': 0.9
             })
-    
+
     # Check player actions for relevance
     for action in structured_data.get('player_actions', []):
         action_text = f"{action.get('player', '')} {action.get('action', '')}".lower()
-        if any(word in action_text for word in question_lower.split()):
+        if q_words.intersection(action_text.split()):
             relevant_timestamps.append({
                 'timestamp': action.get('timestamp'),
                 'description': f"{action.get('player')} {action.get('action')}",
                 'relevance': 0.8
             })
-    
+
     return relevant_timestamps[:5]  # Limit to 5 most relevant
 
 
 def extract_related_players(structured_data: Dict[str, Any], question: str) -> List[str]:
     """Extract player names related to the user's question."""
     related_players = set()
-    question_lower = question.lower()
-    
+    q_words = _question_words(question)
+    if not q_words:
+        return []
+
     # Extract players from actions
     for action in structured_data.get('player_actions', []):
         player_name = action.get('player', '')
         action_text = f"{player_name} {action.get('action', '')}".lower()
-        
-        if any(word in action_text for word in question_lower.split()) or any(word in question_lower for word in player_name.lower().split()):
+
+        if q_words.intersection(action_text.split()):
             related_players.add(player_name)
-    
+
     return list(related_players)
 
 
 # Legacy function for backward compatibility - now implements proper two-stage flow
+def _extract_output_paths(job_metadata: Optional[Dict[str, Any]]) -> Tuple[Optional[str], Optional[str]]:
+    """Pull the standard and custom output S3 paths out of job metadata."""
+    segments = ((job_metadata or {}).get('output_metadata') or [{}])[0].get('segment_metadata') or [{}]
+    segment = segments[0]
+    return segment.get('standard_output_path'), segment.get('custom_output_path')
+
+
 async def invoke_data_automation_and_get_results(
     s3_uri: str, project_arn: Optional[str] = None
 ) -> Optional[Dict[str, Any]]:
@@ -742,23 +817,36 @@ async def invoke_data_automation_and_get_results(
             da_job = await invoke_bedrock_data_automation(s3_uri, project_arn)
             invocation_arn = da_job['invocationArn']
             
-            # Poll for completion (in production, use async processing)
+            # Poll with exponential backoff: short intervals catch fast jobs
+            # quickly, the cap keeps long jobs cheap to watch.
             max_wait_time = 1800  # 30 minutes
-            poll_interval = 30    # 30 seconds
-            elapsed_time = 0
-            
+            poll_interval = 1.0
+            max_poll_interval = 30.0
+            started = time.monotonic()
+
             # Use the runtime client to check status
             da_runtime_client = get_bedrock_data_automation_runtime_client()
-            
-            while elapsed_time < max_wait_time:
-                await asyncio.sleep(poll_interval)
-                elapsed_time += poll_interval
-                
+
+            while time.monotonic() - started < max_wait_time:
+                # ±20% jitter so concurrent jobs do not poll in lockstep
+                await asyncio.sleep(poll_interval * random.uniform(0.8, 1.2))
+                poll_interval = min(poll_interval * 2, max_poll_interval)
+
                 # Log progress
-                logger.info(f'Polling Data Automation status... ({elapsed_time}s / {max_wait_time}s elapsed)')
-                
+                elapsed_time = time.monotonic() - started
+                logger.info(f'Polling Data Automation status... ({elapsed_time:.0f}s / {max_wait_time}s elapsed)')
+
                 # Check status using invocation ARN
-                get_response = da_runtime_client.get_data_automation_status(invocationArn=invocation_arn)
+                try:
+                    get_response = await _run_blocking(
+                        da_runtime_client.get_data_automation_status, invocationArn=invocation_arn
+                    )
+                except ClientError as poll_error:
+                    if poll_error.response.get('Error', {}).get('Code') == 'ThrottlingException':
+                        poll_interval = min(poll_interval * 2, max_poll_interval)
+                        logger.warning(f'Status poll throttled, backing off to {poll_interval:.0f}s')
+                        continue
+                    raise
                 status = get_response.get('status')
                 
                 logger.info(f'Current status: {status}')
@@ -773,34 +861,28 @@ async def invoke_data_automation_and_get_results(
                     job_metadata = await download_from_s3(output_uri)
                     
                     # Extract output paths
-                    standard_output_uri = None
-                    custom_output_uri = None
-                    
-                    if job_metadata:
-                        try:
-                            standard_output_uri = job_metadata['output_metadata'][0]['segment_metadata'][0].get('standard_output_path')
-                        except (KeyError, IndexError):
-                            pass
-                        
-                        try:
-                            custom_output_uri = job_metadata['output_metadata'][0]['segment_metadata'][0].get('custom_output_path')
-                        except (KeyError, IndexError):
-                            pass
-                    
+                    standard_output_uri, custom_output_uri = _extract_output_paths(job_metadata)
+
                     if not standard_output_uri and not custom_output_uri:
                         raise ValueError('Data Automation completed but no output files found')
                     
-                    # Download results
-                    results = {}
+                    # Download both result files concurrently
+                    download_tasks = {}
                     if standard_output_uri:
-                        standard_output = await download_from_s3(standard_output_uri)
-                        if standard_output:
-                            results['standardOutput'] = standard_output
-                    
+                        download_tasks['standardOutput'] = asyncio.ensure_future(
+                            download_from_s3(standard_output_uri)
+                        )
                     if custom_output_uri:
-                        custom_output = await download_from_s3(custom_output_uri)
-                        if custom_output:
-                            results['customOutput'] = custom_output
+                        download_tasks['customOutput'] = asyncio.ensure_future(
+                            download_from_s3(custom_output_uri)
+                        )
+
+                    downloaded = await asyncio.gather(*download_tasks.values())
+                    results = {
+                        key: output
+                        for key, output in zip(download_tasks, downloaded)
+                        if output
+                    }
                     
                     logger.info('Two-stage analysis completed successfully')
                     return results
@@ -862,7 +944,7 @@ async def get_bedrock_project(project_arn: str) -> Dict[str, Any]:
     client = get_bedrock_data_automation_client()
     
     # Extract agent ID from ARN
-    agent_id = project_arn.split('/')[-1] if '/' in project_arn else project_arn
+    agent_id = project_arn.rpartition('/')[2] or project_arn
     
     try:
         response = client.get_agent(agentId=agent_id)
@@ -887,13 +969,29 @@ async def get_bedrock_project(project_arn: str) -> Dict[str, Any]:
         }
 
 
-async def verify_data_automation_permissions() -> Dict[str, Any]:
+# Last verification result and when it was taken; health dashboards poll
+# the verify endpoint, and each run costs half a dozen AWS API calls.
+_VERIFY_CACHE: Optional[Tuple[float, Dict[str, Any]]] = None
+_VERIFY_TTL = float(os.environ.get('VERIFY_TTL_SEC', '60'))
+
+
+async def verify_data_automation_permissions(force_refresh: bool = False) -> Dict[str, Any]:
     """
     Verify that Bedrock Data Automation has proper permissions.
     Returns diagnostic information about the current setup.
+
+    Results are cached for a short TTL; pass force_refresh=True to
+    re-check immediately (e.g. right before attempting fixes).
     """
+    global _VERIFY_CACHE
+
+    if not force_refresh and _VERIFY_CACHE is not None:
+        cached_at, cached_results = _VERIFY_CACHE
+        if time.monotonic() - cached_at < _VERIFY_TTL:
+            return copy.deepcopy(cached_results)
+
     logger.info('Verifying Bedrock Data Automation permissions...')
-    
+
     verification_results = {
         'iam_role_exists': False,
         'iam_role_arn': None,
@@ -907,62 +1005,72 @@ async def verify_data_automation_permissions() -> Dict[str, Any]:
         'recommendations': []
     }
     
-    try:
-        # Check IAM role
-        session = get_aws_session()
-        iam_client = session.client('iam', region_name=get_region())
-        
+    async def _check_iam() -> None:
+        iam_client = _get_client('iam', get_region())
         try:
-            role_response = iam_client.get_role(RoleName='BedrockDataAutomationExecutionRole')
+            role_response = await _run_blocking(
+                iam_client.get_role, RoleName='BedrockDataAutomationExecutionRole'
+            )
             verification_results['iam_role_exists'] = True
             verification_results['iam_role_arn'] = role_response['Role']['Arn']
-            
+
             # Get role policies
-            policies_response = iam_client.list_role_policies(RoleName='BedrockDataAutomationExecutionRole')
+            policies_response = await _run_blocking(
+                iam_client.list_role_policies, RoleName='BedrockDataAutomationExecutionRole'
+            )
             verification_results['iam_role_policies'] = policies_response.get('PolicyNames', [])
-            
+
         except iam_client.exceptions.NoSuchEntityException:
             verification_results['permissions_issues'].append('BedrockDataAutomationExecutionRole does not exist')
             verification_results['recommendations'].append('Run deployment script to create the IAM role')
-        
-        # Check S3 bucket
+
+    async def _check_s3() -> None:
         bucket_name = get_bucket_name()
-        if bucket_name:
-            s3_client = get_s3_client()
-            
+        if not bucket_name:
+            return
+        s3_client = get_s3_client()
+
+        try:
+            await _run_blocking(s3_client.head_bucket, Bucket=bucket_name)
+            verification_results['s3_bucket_exists'] = True
+            verification_results['s3_bucket_name'] = bucket_name
+
+            # Try to get bucket policy
             try:
-                s3_client.head_bucket(Bucket=bucket_name)
-                verification_results['s3_bucket_exists'] = True
-                verification_results['s3_bucket_name'] = bucket_name
-                
-                # Try to get bucket policy
-                try:
-                    policy_response = s3_client.get_bucket_policy(Bucket=bucket_name)
-                    verification_results['s3_bucket_policy'] = 'exists'
-                except s3_client.exceptions.NoSuchBucketPolicy:
-                    verification_results['s3_bucket_policy'] = 'missing'
-                    verification_results['permissions_issues'].append('S3 bucket policy is missing')
-                    verification_results['recommendations'].append('Update S3 bucket policy to allow Bedrock Data Automation access')
-                    
-            except Exception as e:
-                verification_results['permissions_issues'].append(f'S3 bucket {bucket_name} is not accessible: {str(e)}')
-        
-        # Check Data Automation project
+                policy_response = await _run_blocking(
+                    s3_client.get_bucket_policy, Bucket=bucket_name
+                )
+                verification_results['s3_bucket_policy'] = 'exists'
+            except s3_client.exceptions.NoSuchBucketPolicy:
+                verification_results['s3_bucket_policy'] = 'missing'
+                verification_results['permissions_issues'].append('S3 bucket policy is missing')
+                verification_results['recommendations'].append('Update S3 bucket policy to allow Bedrock Data Automation access')
+
+        except Exception as e:
+            verification_results['permissions_issues'].append(f'S3 bucket {bucket_name} is not accessible: {str(e)}')
+
+    async def _check_da_project() -> None:
         project_arn = os.environ.get('DATA_AUTOMATION_PROJECT_ARN')
         if project_arn and project_arn != 'your-project-arn-here':
             try:
                 da_client = get_bedrock_data_automation_client()
-                project_response = da_client.get_data_automation_project(projectArn=project_arn)
+                project_response = await _run_blocking(
+                    da_client.get_data_automation_project, projectArn=project_arn
+                )
                 verification_results['data_automation_project_exists'] = True
                 verification_results['data_automation_project_arn'] = project_arn
-                
+
             except Exception as e:
                 verification_results['permissions_issues'].append(f'Data Automation project not accessible: {str(e)}')
                 verification_results['recommendations'].append('Verify Data Automation project ARN in environment variables')
         else:
             verification_results['permissions_issues'].append('Data Automation project ARN not configured')
             verification_results['recommendations'].append('Set DATA_AUTOMATION_PROJECT_ARN in environment variables')
-        
+
+    try:
+        # The three checks hit different services; run them concurrently
+        await asyncio.gather(_check_iam(), _check_s3(), _check_da_project())
+
         # Overall assessment
         if not verification_results['permissions_issues']:
             verification_results['status'] = 'HEALTHY'
@@ -970,9 +1078,10 @@ async def verify_data_automation_permissions() -> Dict[str, Any]:
             verification_results['status'] = 'NEEDS_ATTENTION'
         else:
             verification_results['status'] = 'CRITICAL'
-        
+
+        _VERIFY_CACHE = (time.monotonic(), copy.deepcopy(verification_results))
         return verification_results
-        
+
     except Exception as e:
         logger.error(f'Failed to verify Data Automation permissions: {e}')
         verification_results['permissions_issues'].append(f'Verification failed: {str(e)}')
@@ -980,6 +1089,128 @@ async def verify_data_automation_permissions() -> Dict[str, Any]:
         return verification_results
 
 
+# Policy documents for the fix path, serialized once at import. Only the
+# account id, region and bucket name vary per deployment; they are spliced
+# in with str.replace at call time.
+_TRUST_POLICY_TMPL = json.dumps({
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Principal": {
+                "Service": "bedrock.amazonaws.com"
+            },
+            "Action": "sts:AssumeRole",
+            "Condition": {
+                "StringEquals": {
+                    "aws:SourceAccount": "__ACCOUNT_ID__"
+                }
+            }
+        }
+    ]
+})
+
+_EXEC_POLICY_TMPL = json.dumps({
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Sid": "S3BucketAccess",
+            "Effect": "Allow",
+            "Action": [
+                "s3:GetObject",
+                "s3:GetObjectVersion",
+                "s3:PutObject",
+                "s3:PutObjectAcl",
+                "s3:DeleteObject",
+                "s3:ListBucket",
+                "s3:GetBucketLocation",
+                "s3:GetBucketVersioning"
+            ],
+            "Resource": [
+                "arn:aws:s3:::__BUCKET_NAME__",
+                "arn:aws:s3:::__BUCKET_NAME__/*"
+            ]
+        },
+        {
+            "Sid": "CloudWatchLogsAccess",
+            "Effect": "Allow",
+            "Action": [
+                "logs:CreateLogGroup",
+                "logs:CreateLogStream",
+                "logs:PutLogEvents",
+                "logs:DescribeLogGroups",
+                "logs:DescribeLogStreams"
+            ],
+            "Resource": "arn:aws:logs:__REGION__:__ACCOUNT_ID__:*"
+        },
+        {
+            "Sid": "BedrockDataAutomationAccess",
+            "Effect": "Allow",
+            "Action": [
+                "bedrock:InvokeModel",
+                "bedrock:GetFoundationModel",
+                "bedrock:ListFoundationModels"
+            ],
+            "Resource": "*"
+        }
+    ]
+})
+
+_BUCKET_POLICY_TMPL = json.dumps({
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Sid": "AllowBedrockDataAutomationRole",
+            "Effect": "Allow",
+            "Principal": {
+                "AWS": "arn:aws:iam::__ACCOUNT_ID__:role/BedrockDataAutomationExecutionRole"
+            },
+            "Action": [
+                "s3:GetObject",
+                "s3:GetObjectVersion",
+                "s3:PutObject",
+                "s3:PutObjectAcl",
+                "s3:DeleteObject",
+                "s3:ListBucket",
+                "s3:GetBucketLocation",
+                "s3:GetBucketVersioning"
+            ],
+            "Resource": [
+                "arn:aws:s3:::__BUCKET_NAME__",
+                "arn:aws:s3:::__BUCKET_NAME__/*"
+            ]
+        },
+        {
+            "Sid": "AllowBedrockServices",
+            "Effect": "Allow",
+            "Principal": {
+                "Service": [
+                    "bedrock.amazonaws.com",
+                    "bedrock-data-automation.amazonaws.com"
+                ]
+            },
+            "Action": [
+                "s3:GetObject",
+                "s3:GetObjectVersion",
+                "s3:PutObject",
+                "s3:PutObjectAcl",
+                "s3:ListBucket",
+                "s3:GetBucketLocation"
+            ],
+            "Resource": [
+                "arn:aws:s3:::__BUCKET_NAME__",
+                "arn:aws:s3:::__BUCKET_NAME__/*"
+            ],
+            "Condition": {
+                "StringEquals": {
+                    "aws:SourceAccount": "__ACCOUNT_ID__"
+                }
+            }
+        }
+    ]
+})
+
+
 async def fix_data_automation_permissions() -> Dict[str, Any]:
     """
     Attempt to fix common Bedrock Data Automation permission issues.
@@ -994,11 +1225,10 @@ async def fix_data_automation_permissions() -> Dict[str, Any]:
     }
     
     try:
-        # First, verify current state
-        verification = await verify_data_automation_permissions()
+        # First, verify current state (skip the cache - we act on this)
+        verification = await verify_data_automation_permissions(force_refresh=True)
         
-        session = get_aws_session()
-        iam_client = session.client('iam', region_name=get_region())
+        iam_client = _get_client('iam', get_region())
         account_id = get_account_id()
         region = get_region()
         bucket_name = get_bucket_name()
@@ -1006,29 +1236,11 @@ async def fix_data_automation_permissions() -> Dict[str, Any]:
         # Fix IAM role if needed
         if not verification['iam_role_exists']:
             try:
-                # Create trust policy
-                trust_policy = {
-                    "Version": "2012-10-17",
-                    "Statement": [
-                        {
-                            "Effect": "Allow",
-                            "Principal": {
-                                "Service": "bedrock.amazonaws.com"
-                            },
-                            "Action": "sts:AssumeRole",
-                            "Condition": {
-                                "StringEquals": {
-                                    "aws:SourceAccount": account_id
-                                }
-                            }
-                        }
-                    ]
-                }
-                
                 # Create role
-                iam_client.create_role(
+                await _run_blocking(
+                    iam_client.create_role,
                     RoleName='BedrockDataAutomationExecutionRole',
-                    AssumeRolePolicyDocument=json.dumps(trust_policy),
+                    AssumeRolePolicyDocument=_TRUST_POLICY_TMPL.replace('__ACCOUNT_ID__', account_id),
                     Description='IAM role for Bedrock Data Automation to access S3 bucket and CloudWatch'
                 )
                 
@@ -1040,57 +1252,18 @@ async def fix_data_automation_permissions() -> Dict[str, Any]:
         # Update IAM role policies
         if verification['iam_role_exists'] or 'Created BedrockDataAutomationExecutionRole' in fix_results['actions_taken']:
             try:
-                # Create comprehensive policy
-                policy_document = {
-                    "Version": "2012-10-17",
-                    "Statement": [
-                        {
-                            "Sid": "S3BucketAccess",
-                            "Effect": "Allow",
-                            "Action": [
-                                "s3:GetObject",
-                                "s3:GetObjectVersion",
-                                "s3:PutObject",
-                                "s3:PutObjectAcl",
-                                "s3:DeleteObject",
-                                "s3:ListBucket",
-                                "s3:GetBucketLocation",
-                                "s3:GetBucketVersioning"
-                            ],
-                            "Resource": [
-                                f"arn:aws:s3:::{bucket_name}",
-                                f"arn:aws:s3:::{bucket_name}/*"
-                            ]
-                        },
-                        {
-                            "Sid": "CloudWatchLogsAccess",
-                            "Effect": "Allow",
-                            "Action": [
-                                "logs:CreateLogGroup",
-                                "logs:CreateLogStream",
-                                "logs:PutLogEvents",
-                                "logs:DescribeLogGroups",
-                                "logs:DescribeLogStreams"
-                            ],
-                            "Resource": f"arn:aws:logs:{region}:{account_id}:*"
-                        },
-                        {
-                            "Sid": "BedrockDataAutomationAccess",
-                            "Effect": "Allow",
-                            "Action": [
-                                "bedrock:InvokeModel",
-                                "bedrock:GetFoundationModel",
-                                "bedrock:ListFoundationModels"
-                            ],
-                            "Resource": "*"
-                        }
-                    ]
-                }
-                
-                iam_client.put_role_policy(
+                policy_document = (
+                    _EXEC_POLICY_TMPL
+                    .replace('__BUCKET_NAME__', bucket_name)
+                    .replace('__REGION__', region)
+                    .replace('__ACCOUNT_ID__', account_id)
+                )
+
+                await _run_blocking(
+                    iam_client.put_role_policy,
                     RoleName='BedrockDataAutomationExecutionRole',
                     PolicyName='BedrockDataAutomationComprehensiveAccess',
-                    PolicyDocument=json.dumps(policy_document)
+                    PolicyDocument=policy_document
                 )
                 
                 fix_results['actions_taken'].append('Updated IAM role policies')
@@ -1102,64 +1275,17 @@ async def fix_data_automation_permissions() -> Dict[str, Any]:
         if verification['s3_bucket_exists'] and verification['s3_bucket_policy'] == 'missing':
             try:
                 s3_client = get_s3_client()
-                
-                bucket_policy = {
-                    "Version": "2012-10-17",
-                    "Statement": [
-                        {
-                            "Sid": "AllowBedrockDataAutomationRole",
-                            "Effect": "Allow",
-                            "Principal": {
-                                "AWS": f"arn:aws:iam::{account_id}:role/BedrockDataAutomationExecutionRole"
-                            },
-                            "Action": [
-                                "s3:GetObject",
-                                "s3:GetObjectVersion",
-                                "s3:PutObject",
-                                "s3:PutObjectAcl",
-                                "s3:DeleteObject",
-                                "s3:ListBucket",
-                                "s3:GetBucketLocation",
-                                "s3:GetBucketVersioning"
-                            ],
-                            "Resource": [
-                                f"arn:aws:s3:::{bucket_name}",
-                                f"arn:aws:s3:::{bucket_name}/*"
-                            ]
-                        },
-                        {
-                            "Sid": "AllowBedrockServices",
-                            "Effect": "Allow",
-                            "Principal": {
-                                "Service": [
-                                    "bedrock.amazonaws.com",
-                                    "bedrock-data-automation.amazonaws.com"
-                                ]
-                            },
-                            "Action": [
-                                "s3:GetObject",
-                                "s3:GetObjectVersion",
-                                "s3:PutObject",
-                                "s3:PutObjectAcl",
-                                "s3:ListBucket",
-                                "s3:GetBucketLocation"
-                            ],
-                            "Resource": [
-                                f"arn:aws:s3:::{bucket_name}",
-                                f"arn:aws:s3:::{bucket_name}/*"
-                            ],
-                            "Condition": {
-                                "StringEquals": {
-                                    "aws:SourceAccount": account_id
-                                }
-                            }
-                        }
-                    ]
-                }
-                
-                s3_client.put_bucket_policy(
+
+                bucket_policy = (
+                    _BUCKET_POLICY_TMPL
+                    .replace('__BUCKET_NAME__', bucket_name)
+                    .replace('__ACCOUNT_ID__', account_id)
+                )
+
+                await _run_blocking(
+                    s3_client.put_bucket_policy,
                     Bucket=bucket_name,
-                    Policy=json.dumps(bucket_policy)
+                    Policy=bucket_policy
                 )
                 
                 fix_results['actions_taken'].append('Updated S3 bucket policy')
@@ -1183,6 +1309,30 @@ async def fix_data_automation_permissions() -> Dict[str, Any]:
         return fix_results
 
 
+# Error-code routing for the access test; dispatching on the ClientError
+# code avoids substring scans over exception text.
+_MISSING_OBJECT_CODES = frozenset({'NoSuchKey', 'NotFound', 'ResourceNotFoundException'})
+
+_ACCESS_DENIED_RECOMMENDATIONS = [
+    'Check IAM role permissions for Bedrock Data Automation',
+    'Verify S3 bucket policy allows Bedrock service access',
+    'Ensure Data Automation project has correct execution role assigned'
+]
+_INVALID_PARAMETER_RECOMMENDATIONS = [
+    'Verify Data Automation project ARN is correct',
+    'Check S3 URI format and accessibility'
+]
+_ACCESS_TEST_RECOMMENDATIONS = {
+    'NoSuchKey': ['Verify S3 object exists and is accessible'],
+    'NotFound': ['Verify S3 object exists and is accessible'],
+    'ResourceNotFoundException': ['Verify S3 object exists and is accessible'],
+    'AccessDenied': _ACCESS_DENIED_RECOMMENDATIONS,
+    'AccessDeniedException': _ACCESS_DENIED_RECOMMENDATIONS,
+    'InvalidParameterException': _INVALID_PARAMETER_RECOMMENDATIONS,
+    'ValidationException': _INVALID_PARAMETER_RECOMMENDATIONS,
+}
+
+
 async def test_data_automation_access(s3_uri: str) -> Dict[str, Any]:
     """
     Test Bedrock Data Automation access by attempting a minimal operation.
@@ -1206,28 +1356,19 @@ async def test_data_automation_access(s3_uri: str) -> Dict[str, Any]:
             test_results['recommendations'].append('Set DATA_AUTOMATION_PROJECT_ARN in environment variables')
             return test_results
         
-        # Test basic S3 access first
-        bucket, key = get_bucket_and_key_from_s3_uri(s3_uri)
-        s3_client = get_s3_client()
-        
-        try:
-            s3_client.head_object(Bucket=bucket, Key=key)
-        except Exception as e:
-            test_results['error_message'] = f'S3 object not accessible: {str(e)}'
-            test_results['recommendations'].append('Verify S3 object exists and is accessible')
-            return test_results
-        
-        # Test Data Automation API access
+        # Test Data Automation API access; a missing S3 object surfaces
+        # as an invoke error, so no separate HEAD pre-check is needed
         try:
             da_runtime_client = get_bedrock_data_automation_runtime_client()
             
             # Generate unique job name for test
-            test_job_name = f"access-test-{uuid.uuid4()}"
+            test_job_name = f"access-test-{_random_hex()}"
             bucket_name = get_bucket_name()
             output_prefix = f"test-results/{test_job_name}/"
             
             # Attempt to start a Data Automation job (this will test permissions)
-            response = da_runtime_client.invoke_data_automation_async(
+            response = await _run_blocking(
+                da_runtime_client.invoke_data_automation_async,
                 inputConfiguration={
                     's3Uri': s3_uri
                 },
@@ -1247,31 +1388,35 @@ async def test_data_automation_access(s3_uri: str) -> Dict[str, Any]:
             
             logger.info(f'Data Automation access test passed. Test job ARN: {job_arn}')
             
-            # Optionally cancel the test job to avoid unnecessary processing
+            # Cancel the test job off the return path; the result only
+            # matters for logging, so scheduling errors (including the
+            # operation missing from the service model) stay out of the
+            # test verdict.
             try:
                 da_client = get_bedrock_data_automation_client()
-                da_client.stop_data_automation_job(jobArn=job_arn)
-                logger.info('Cancelled test job to avoid unnecessary processing')
+                cancel_task = asyncio.ensure_future(
+                    _run_blocking(da_client.stop_data_automation_job, jobArn=job_arn)
+                )
+                cancel_task.add_done_callback(
+                    lambda t: logger.debug('Test job cancel result: %r', t.exception())
+                )
             except Exception:
                 pass  # Ignore cancellation errors
             
-        except Exception as e:
-            error_str = str(e)
-            test_results['error_message'] = f'Data Automation API call failed: {error_str}'
-            
-            if 'AccessDenied' in error_str:
-                test_results['recommendations'].extend([
-                    'Check IAM role permissions for Bedrock Data Automation',
-                    'Verify S3 bucket policy allows Bedrock service access',
-                    'Ensure Data Automation project has correct execution role assigned'
-                ])
-            elif 'InvalidParameter' in error_str:
-                test_results['recommendations'].extend([
-                    'Verify Data Automation project ARN is correct',
-                    'Check S3 URI format and accessibility'
-                ])
+        except ClientError as e:
+            code = e.response.get('Error', {}).get('Code', '')
+
+            if code in _MISSING_OBJECT_CODES:
+                test_results['error_message'] = f'S3 object not accessible: {e}'
             else:
-                test_results['recommendations'].append('Run permission verification and fix operations')
+                test_results['error_message'] = f'Data Automation API call failed: {e}'
+
+            test_results['recommendations'].extend(
+                _ACCESS_TEST_RECOMMENDATIONS.get(code, ['Run permission verification and fix operations'])
+            )
+        except Exception as e:
+            test_results['error_message'] = f'Data Automation API call failed: {str(e)}'
+            test_results['recommendations'].append('Run permission verification and fix operations')
         
         return test_results
         
@@ -1279,3 +1424,18 @@ async def test_data_automation_access(s3_uri: str) -> Dict[str, Any]:
         logger.error(f'Data Automation access test failed: {e}')
         test_results['error_message'] = f'Access test failed: {str(e)}'
         return test_results
+
+
+def _warm_identity_cache() -> None:
+    """Best-effort prefetch of the STS-derived identity and profile ARN."""
+    try:
+        get_profile_arn()
+    except Exception:
+        # No credentials available at init time (e.g. local tooling); the
+        # first caller resolves it on demand since failures are not cached
+        pass
+
+
+# Resolve the account id during init, off the request path, so the first
+# invoke_bedrock_data_automation call does not pay the STS round-trip
+_EXECUTOR.submit(_warm_identity_cache)
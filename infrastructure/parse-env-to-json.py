@@ -4,45 +4,48 @@ Parse .env file and output JSON array for ECS task definition.
 """
 
 import json
+import re
 import sys
 import os
 
+# One match per line does the whitespace, comment, optional `export`
+# prefix and key validation in a single pass of the C regex engine.
+_ENV_RE = re.compile(r'^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*$')
+
 def parse_env_file(filepath):
     """Parse .env file and return list of environment variable dicts."""
     env_vars = []
-    
+
     if not os.path.exists(filepath):
         return env_vars
-    
-    with open(filepath, 'r') as f:
+
+    # errors='replace' keeps a stray BOM or bad byte from killing a deploy
+    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
         for line in f:
-            line = line.strip()
-            
-            # Skip comments and empty lines
-            if not line or line.startswith('#'):
-                continue
-            
-            # Split on first = only
-            if '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                if key:  # Only add if key is not empty
-                    env_vars.append({
-                        "name": key,
-                        "value": value
-                    })
-    
+            m = _ENV_RE.match(line)
+            if m:
+                env_vars.append({
+                    "name": m[1],
+                    "value": m[2]
+                })
+
     return env_vars
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: parse-env-to-json.py <path-to-env-file>", file=sys.stderr)
+    if len(sys.argv) not in (2, 3):
+        print("Usage: parse-env-to-json.py <path-to-env-file> [output-file]", file=sys.stderr)
         sys.exit(1)
-    
+
     env_file = sys.argv[1]
     env_vars = parse_env_file(env_file)
-    
-    # Output as JSON array
-    print(json.dumps(env_vars))
+
+    # Stream compact JSON chunk by chunk instead of materializing the
+    # whole document before the first byte is written
+    encoder = json.JSONEncoder(separators=(',', ':'))
+
+    if len(sys.argv) == 3:
+        with open(sys.argv[2], 'w', encoding='utf-8') as out:
+            out.writelines(encoder.iterencode(env_vars))
+    else:
+        sys.stdout.writelines(encoder.iterencode(env_vars))
+        sys.stdout.write('\n')